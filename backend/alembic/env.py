@@ -1,5 +1,6 @@
 import asyncio
 import sys
+from contextlib import contextmanager
 from logging.config import fileConfig
 
 from sqlalchemy import pool
@@ -55,6 +56,11 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+# Fail a migration instead of queueing behind a long-running transaction:
+# a waiting ALTER TABLE blocks every later query on that table, so a stuck
+# lock is aborted after this long and the deploy can simply be retried.
+LOCK_TIMEOUT = "5s"
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -85,10 +91,44 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _without_lock_timeout(migration_context):
+    """
+    Wrap a MigrationContext's autocommit_block to lift lock_timeout inside it.
+
+    Autocommit blocks run CREATE/DROP INDEX CONCURRENTLY, which waits for
+    every older transaction to finish; that wait counts against
+    lock_timeout, and a build that times out leaves an INVALID index that
+    a rerun's IF NOT EXISTS would then skip. Concurrent builds don't block
+    writes, so they may wait as long as they need.
+    """
+    autocommit_block = migration_context.autocommit_block
+
+    @contextmanager
+    def block():
+        with autocommit_block():
+            # The block swaps in an AUTOCOMMIT connection; set it on that one
+            connection = migration_context.connection
+            connection.exec_driver_sql("SET lock_timeout = 0")
+            try:
+                yield
+            finally:
+                connection.exec_driver_sql(f"SET lock_timeout = '{LOCK_TIMEOUT}'")
+
+    return block
+
+
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with the provided connection."""
+    # Session-level, so it holds across the transactions Alembic begins
+    # around autocommit blocks; the blocks themselves run without it.
+    # Commit the autobegun transaction so Alembic still owns its own.
+    connection.exec_driver_sql(f"SET lock_timeout = '{LOCK_TIMEOUT}'")
+    connection.commit()
     context.configure(connection=connection, target_metadata=target_metadata)
 
+    migration_context = context.get_context()
+    migration_context.autocommit_block = _without_lock_timeout(migration_context)
+
     with context.begin_transaction():
         context.run_migrations()
 
@@ -5,116 +5,120 @@ Revises:
 Create Date: 2026-01-24
 
 """
-from typing import Sequence, Union
-
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
 
 
 # revision identifiers, used by Alembic.
-revision: str = '001'
-down_revision: Union[str, None] = None
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
+revision = '001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _id_col() -> sa.Column:
+    return sa.Column('id', UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), primary_key=True)
+
+
+def _tenant_id_col() -> sa.Column:
+    return sa.Column('tenant_id', UUID(as_uuid=True), nullable=False)
+
+
+def _timestamps() -> tuple[sa.Column, sa.Column]:
+    return (
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    )
 
 
 def upgrade() -> None:
-    """Create all initial tables."""
+    """Create all initial tables, then their indexes."""
+    _create_tables()
+    _create_indexes()
+
+
+def _create_tables() -> None:
+    """
+    Create all initial tables without secondary indexes.
+
+    Kept separate from _create_indexes() so bulk loads (seeds, dev
+    restores) can run between the two phases and build each index once.
+    """
 
     # Create tenants table (NO tenant_id - it IS a tenant)
     op.create_table(
         'tenants',
-        sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
-        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        _id_col(),
+        *_timestamps(),
         sa.Column('name', sa.String(length=255), nullable=False),
         sa.Column('slug', sa.String(length=100), nullable=False),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('slug')
     )
-    op.create_index(op.f('ix_tenants_slug'), 'tenants', ['slug'], unique=False)
 
     # Create users table
     op.create_table(
         'users',
-        sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
-        sa.Column('tenant_id', sa.UUID(), nullable=False),
-        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        _id_col(),
+        _tenant_id_col(),
+        *_timestamps(),
         sa.Column('email', sa.String(length=255), nullable=False),
         sa.Column('password_hash', sa.String(length=255), nullable=False),
         sa.Column('full_name', sa.String(length=255), nullable=False),
         sa.Column('role', sa.String(length=50), nullable=False, server_default='technician'),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('email')
     )
-    op.create_index(op.f('ix_users_tenant_id'), 'users', ['tenant_id'], unique=False)
-    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=False)
 
     # Create templates table
     op.create_table(
         'templates',
-        sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
-        sa.Column('tenant_id', sa.UUID(), nullable=False),
-        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        _id_col(),
+        _tenant_id_col(),
+        *_timestamps(),
         sa.Column('name', sa.String(length=255), nullable=False),
         sa.Column('description', sa.Text(), nullable=True),
         sa.Column('schema_json', sa.Text(), nullable=False),
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.PrimaryKeyConstraint('id')
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true')
     )
-    op.create_index(op.f('ix_templates_tenant_id'), 'templates', ['tenant_id'], unique=False)
 
     # Create projects table
     op.create_table(
         'projects',
-        sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
-        sa.Column('tenant_id', sa.UUID(), nullable=False),
-        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        _id_col(),
+        _tenant_id_col(),
+        *_timestamps(),
         sa.Column('name', sa.String(length=255), nullable=False),
         sa.Column('description', sa.Text(), nullable=True),
         sa.Column('client_name', sa.String(length=255), nullable=False),
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.PrimaryKeyConstraint('id')
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true')
     )
-    op.create_index(op.f('ix_projects_tenant_id'), 'projects', ['tenant_id'], unique=False)
 
     # Create reports table
     op.create_table(
         'reports',
-        sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
-        sa.Column('tenant_id', sa.UUID(), nullable=False),
-        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        _id_col(),
+        _tenant_id_col(),
+        *_timestamps(),
         sa.Column('title', sa.String(length=255), nullable=False),
         sa.Column('status', sa.String(length=50), nullable=False, server_default='draft'),
         sa.Column('data_json', sa.Text(), nullable=False),
         sa.Column('location', sa.Text(), nullable=True, comment='Geographic location as text (lat,lon) - Phase 1'),
-        sa.Column('template_id', sa.UUID(), nullable=False),
-        sa.Column('project_id', sa.UUID(), nullable=False),
-        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('template_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('project_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', UUID(as_uuid=True), nullable=False),
         sa.ForeignKeyConstraint(['template_id'], ['templates.id'], ondelete='RESTRICT'),
         sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='RESTRICT'),
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='RESTRICT'),
-        sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_reports_tenant_id'), 'reports', ['tenant_id'], unique=False)
-    op.create_index(op.f('ix_reports_status'), 'reports', ['status'], unique=False)
-    op.create_index(op.f('ix_reports_template_id'), 'reports', ['template_id'], unique=False)
-    op.create_index(op.f('ix_reports_project_id'), 'reports', ['project_id'], unique=False)
-    op.create_index(op.f('ix_reports_user_id'), 'reports', ['user_id'], unique=False)
 
     # Create report_photos table
     op.create_table(
         'report_photos',
-        sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
-        sa.Column('tenant_id', sa.UUID(), nullable=False),
-        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        _id_col(),
+        _tenant_id_col(),
+        *_timestamps(),
         sa.Column('file_key', sa.String(length=500), nullable=False),
         sa.Column('original_filename', sa.String(length=255), nullable=False),
         sa.Column('mime_type', sa.String(length=100), nullable=False),
@@ -122,14 +126,34 @@ def upgrade() -> None:
         sa.Column('location', sa.Text(), nullable=True, comment='Geographic location as text (lat,lon) - Phase 1'),
         sa.Column('watermark_applied', sa.Boolean(), nullable=False, server_default='false'),
         sa.Column('caption', sa.Text(), nullable=True),
-        sa.Column('report_id', sa.UUID(), nullable=False),
+        sa.Column('report_id', UUID(as_uuid=True), nullable=False),
         sa.ForeignKeyConstraint(['report_id'], ['reports.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('file_key')
     )
-    op.create_index(op.f('ix_report_photos_tenant_id'), 'report_photos', ['tenant_id'], unique=False)
-    op.create_index(op.f('ix_report_photos_file_key'), 'report_photos', ['file_key'], unique=False)
-    op.create_index(op.f('ix_report_photos_report_id'), 'report_photos', ['report_id'], unique=False)
+
+
+def _create_indexes() -> None:
+    """Create secondary indexes for the initial tables in one round-trip."""
+    op.execute(
+        "CREATE INDEX ix_tenants_slug ON tenants (slug);"
+
+        "CREATE INDEX ix_users_tenant_id ON users (tenant_id);"
+        "CREATE INDEX ix_users_email ON users (email);"
+
+        "CREATE INDEX ix_templates_tenant_id ON templates (tenant_id);"
+
+        "CREATE INDEX ix_projects_tenant_id ON projects (tenant_id);"
+
+        "CREATE INDEX ix_reports_tenant_id ON reports (tenant_id);"
+        "CREATE INDEX ix_reports_status ON reports (status);"
+        "CREATE INDEX ix_reports_template_id ON reports (template_id);"
+        "CREATE INDEX ix_reports_project_id ON reports (project_id);"
+        "CREATE INDEX ix_reports_user_id ON reports (user_id);"
+
+        "CREATE INDEX ix_report_photos_tenant_id ON report_photos (tenant_id);"
+        "CREATE INDEX ix_report_photos_file_key ON report_photos (file_key);"
+        "CREATE INDEX ix_report_photos_report_id ON report_photos (report_id)"
+    )
 
 
 def downgrade() -> None:
@@ -5,48 +5,50 @@ Revises: 001
 Create Date: 2026-01-31
 
 """
-from typing import Sequence, Union
-
 from alembic import op
-import sqlalchemy as sa
 
 
 # revision identifiers, used by Alembic.
-revision: str = '002'
-down_revision: Union[str, None] = '001'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
 
 
 def upgrade() -> None:
     """Add branding and contact fields to tenants table."""
 
-    # Branding fields
-    op.add_column('tenants', sa.Column('logo_primary_key', sa.String(length=500), nullable=True))
-    op.add_column('tenants', sa.Column('logo_secondary_key', sa.String(length=500), nullable=True))
-    op.add_column('tenants', sa.Column('brand_color_primary', sa.String(length=7), nullable=True))
-    op.add_column('tenants', sa.Column('brand_color_secondary', sa.String(length=7), nullable=True))
-    op.add_column('tenants', sa.Column('brand_color_accent', sa.String(length=7), nullable=True))
-
-    # Contact fields
-    op.add_column('tenants', sa.Column('contact_address', sa.String(length=500), nullable=True))
-    op.add_column('tenants', sa.Column('contact_phone', sa.String(length=50), nullable=True))
-    op.add_column('tenants', sa.Column('contact_email', sa.String(length=255), nullable=True))
-    op.add_column('tenants', sa.Column('contact_website', sa.String(length=255), nullable=True))
+    # Single ALTER TABLE so the lock on tenants is taken once
+    op.execute(
+        "ALTER TABLE tenants "
+        # Branding fields
+        "ADD COLUMN logo_primary_key VARCHAR(500), "
+        "ADD COLUMN logo_secondary_key VARCHAR(500), "
+        "ADD COLUMN brand_color_primary VARCHAR(7), "
+        "ADD COLUMN brand_color_secondary VARCHAR(7), "
+        "ADD COLUMN brand_color_accent VARCHAR(7), "
+        # Contact fields
+        "ADD COLUMN contact_address VARCHAR(500), "
+        "ADD COLUMN contact_phone VARCHAR(50), "
+        "ADD COLUMN contact_email VARCHAR(255), "
+        "ADD COLUMN contact_website VARCHAR(255)"
+    )
 
 
 def downgrade() -> None:
     """Remove branding and contact fields from tenants table."""
 
-    # Drop contact fields
-    op.drop_column('tenants', 'contact_website')
-    op.drop_column('tenants', 'contact_email')
-    op.drop_column('tenants', 'contact_phone')
-    op.drop_column('tenants', 'contact_address')
-
-    # Drop branding fields
-    op.drop_column('tenants', 'brand_color_accent')
-    op.drop_column('tenants', 'brand_color_secondary')
-    op.drop_column('tenants', 'brand_color_primary')
-    op.drop_column('tenants', 'logo_secondary_key')
-    op.drop_column('tenants', 'logo_primary_key')
+    op.execute(
+        "ALTER TABLE tenants "
+        # Drop contact fields
+        "DROP COLUMN contact_website, "
+        "DROP COLUMN contact_email, "
+        "DROP COLUMN contact_phone, "
+        "DROP COLUMN contact_address, "
+        # Drop branding fields
+        "DROP COLUMN brand_color_accent, "
+        "DROP COLUMN brand_color_secondary, "
+        "DROP COLUMN brand_color_primary, "
+        "DROP COLUMN logo_secondary_key, "
+        "DROP COLUMN logo_primary_key"
+    )
@@ -5,18 +5,27 @@ Revises: 002
 Create Date: 2026-01-31
 
 """
-from typing import Sequence, Union
-
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import UUID
 
 
 # revision identifiers, used by Alembic.
-revision: str = '003'
-down_revision: Union[str, None] = '002'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def _id_col() -> sa.Column:
+    return sa.Column('id', UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()'))
+
+
+def _timestamps() -> tuple[sa.Column, sa.Column]:
+    return (
+        sa.Column('created_at', sa.TIMESTAMP(), nullable=False, server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.TIMESTAMP(), nullable=False, server_default=sa.text('now()')),
+    )
 
 
 def upgrade() -> None:
@@ -32,7 +41,7 @@ def upgrade() -> None:
     # Create new templates table with full schema
     op.create_table(
         'templates',
-        sa.Column('id', UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+        _id_col(),
         sa.Column('tenant_id', UUID(as_uuid=True), nullable=False, index=True),
         sa.Column('name', sa.String(length=255), nullable=False),
         sa.Column('code', sa.String(length=50), nullable=False),
@@ -42,8 +51,7 @@ def upgrade() -> None:
         sa.Column('reference_standards', sa.Text(), nullable=True),
         sa.Column('planning_requirements', sa.Text(), nullable=True),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('created_at', sa.TIMESTAMP(), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.TIMESTAMP(), nullable=False, server_default=sa.text('now()')),
+        *_timestamps(),
         sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], name='fk_templates_tenant_id'),
         sa.UniqueConstraint('tenant_id', 'code', name='uq_template_tenant_code')
     )
@@ -51,26 +59,24 @@ def upgrade() -> None:
     # Create template_sections table
     op.create_table(
         'template_sections',
-        sa.Column('id', UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+        _id_col(),
         sa.Column('template_id', UUID(as_uuid=True), nullable=False),
         sa.Column('name', sa.String(length=255), nullable=False),
         sa.Column('order', sa.Integer(), nullable=False),
-        sa.Column('created_at', sa.TIMESTAMP(), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.TIMESTAMP(), nullable=False, server_default=sa.text('now()')),
+        *_timestamps(),
         sa.ForeignKeyConstraint(['template_id'], ['templates.id'], name='fk_template_sections_template_id', ondelete='CASCADE')
     )
 
     # Create template_fields table
     op.create_table(
         'template_fields',
-        sa.Column('id', UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+        _id_col(),
         sa.Column('section_id', UUID(as_uuid=True), nullable=False),
         sa.Column('label', sa.String(length=500), nullable=False),
         sa.Column('field_type', sa.String(length=50), nullable=False),
         sa.Column('options', sa.Text(), nullable=True),
         sa.Column('order', sa.Integer(), nullable=False),
-        sa.Column('created_at', sa.TIMESTAMP(), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.TIMESTAMP(), nullable=False, server_default=sa.text('now()')),
+        *_timestamps(),
         sa.ForeignKeyConstraint(['section_id'], ['template_sections.id'], name='fk_template_fields_section_id', ondelete='CASCADE')
     )
 
@@ -99,14 +105,13 @@ def downgrade() -> None:
     # Recreate old templates stub (from initial schema)
     op.create_table(
         'templates',
-        sa.Column('id', UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+        _id_col(),
         sa.Column('tenant_id', UUID(as_uuid=True), nullable=False, index=True),
         sa.Column('name', sa.String(length=255), nullable=False),
         sa.Column('description', sa.Text(), nullable=True),
         sa.Column('schema_json', sa.Text(), nullable=False),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('created_at', sa.TIMESTAMP(), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.TIMESTAMP(), nullable=False, server_default=sa.text('now()')),
+        *_timestamps(),
         sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], name='fk_templates_tenant_id')
     )
     op.create_index('ix_templates_tenant_id', 'templates', ['tenant_id'])
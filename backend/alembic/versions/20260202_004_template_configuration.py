@@ -11,7 +11,7 @@ Adds:
 """
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID
 
 # revision identifiers, used by Alembic.
 revision = "004"
@@ -20,44 +20,57 @@ branch_labels = None
 depends_on = None
 
 
+def _id_col() -> sa.Column:
+    return sa.Column("id", UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()"))
+
+
+def _timestamps() -> tuple[sa.Column, sa.Column]:
+    return (
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
+    )
+
+
 def upgrade():
     # Create template_info_fields table
     op.create_table(
         "template_info_fields",
-        sa.Column("id", sa.UUID(), nullable=False, server_default=sa.text("gen_random_uuid()")),
-        sa.Column("template_id", sa.UUID(), nullable=False),
+        _id_col(),
+        sa.Column("template_id", UUID(as_uuid=True), nullable=False),
         sa.Column("label", sa.String(255), nullable=False),
         sa.Column("field_type", sa.String(50), nullable=False),
         sa.Column("options", sa.Text(), nullable=True),
         sa.Column("required", sa.Boolean(), nullable=False, server_default=sa.text("true")),
         sa.Column("order", sa.Integer(), nullable=False),
-        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
-        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
-        sa.PrimaryKeyConstraint("id"),
+        *_timestamps(),
         sa.ForeignKeyConstraint(["template_id"], ["templates.id"], ondelete="CASCADE"),
     )
 
     # Create template_signature_fields table
     op.create_table(
         "template_signature_fields",
-        sa.Column("id", sa.UUID(), nullable=False, server_default=sa.text("gen_random_uuid()")),
-        sa.Column("template_id", sa.UUID(), nullable=False),
+        _id_col(),
+        sa.Column("template_id", UUID(as_uuid=True), nullable=False),
         sa.Column("role_name", sa.String(100), nullable=False),
         sa.Column("required", sa.Boolean(), nullable=False, server_default=sa.text("true")),
         sa.Column("order", sa.Integer(), nullable=False),
-        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
-        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
-        sa.PrimaryKeyConstraint("id"),
+        *_timestamps(),
         sa.ForeignKeyConstraint(["template_id"], ["templates.id"], ondelete="CASCADE"),
     )
 
-    # Add JSONB columns to template_fields
-    op.add_column("template_fields", sa.Column("photo_config", JSONB(), nullable=True))
-    op.add_column("template_fields", sa.Column("comment_config", JSONB(), nullable=True))
+    # Add JSONB columns to template_fields (one ALTER TABLE, one lock)
+    op.execute(
+        "ALTER TABLE template_fields "
+        "ADD COLUMN photo_config JSONB, "
+        "ADD COLUMN comment_config JSONB"
+    )
 
 
 def downgrade():
-    op.drop_column("template_fields", "comment_config")
-    op.drop_column("template_fields", "photo_config")
+    op.execute(
+        "ALTER TABLE template_fields "
+        "DROP COLUMN comment_config, "
+        "DROP COLUMN photo_config"
+    )
     op.drop_table("template_signature_fields")
     op.drop_table("template_info_fields")
@@ -10,6 +10,7 @@ This migration adds:
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
 
 
 # revision identifiers, used by Alembic.
@@ -23,14 +24,14 @@ def upgrade() -> None:
     # Create report_signatures table
     op.create_table(
         "report_signatures",
-        sa.Column("id", sa.UUID(), nullable=False),
-        sa.Column("tenant_id", sa.UUID(), nullable=False),
+        sa.Column("id", UUID(as_uuid=True), nullable=False),
+        sa.Column("tenant_id", UUID(as_uuid=True), nullable=False),
         sa.Column("role_name", sa.String(100), nullable=False),
         sa.Column("signer_name", sa.String(255), nullable=True),
         sa.Column("file_key", sa.String(500), nullable=False),
         sa.Column("signed_at", sa.DateTime(timezone=True), nullable=False),
-        sa.Column("report_id", sa.UUID(), nullable=False),
-        sa.Column("signature_field_id", sa.UUID(), nullable=True),
+        sa.Column("report_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("signature_field_id", UUID(as_uuid=True), nullable=True),
         sa.Column(
             "created_at",
             sa.DateTime(timezone=True),
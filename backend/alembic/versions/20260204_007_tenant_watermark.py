@@ -5,17 +5,15 @@ Revises: 006
 Create Date: 2026-02-04
 
 """
-from typing import Sequence, Union
-
 from alembic import op
 import sqlalchemy as sa
 
 
 # revision identifiers, used by Alembic.
-revision: str = '007'
-down_revision: Union[str, None] = '006'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
 
 
 def upgrade() -> None:
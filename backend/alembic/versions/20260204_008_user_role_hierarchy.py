@@ -12,17 +12,16 @@ This migration:
 After running this migration, create a superadmin user:
     python scripts/create_superadmin.py
 """
-from typing import Sequence, Union
-
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import UUID
 
 
-revision: str = '008'
-down_revision: Union[str, None] = '007'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
 
 
 def upgrade() -> None:
@@ -34,24 +33,24 @@ def upgrade() -> None:
     """
     conn = op.get_bind()
 
-    # Step 1: Delete all data in correct order (respecting foreign keys)
-    # These tables all exist from prior migrations (001-007)
-    tables_to_clean = [
-        'report_signatures',
-        'report_checklist_responses',
-        'report_info_values',
-        'reports',
-        'users'
-    ]
-
-    for table in tables_to_clean:
-        conn.execute(text(f"DELETE FROM {table}"))
+    # Step 1: Delete all data in a single statement (clean slate)
+    # These tables all exist from prior migrations (001-007).
+    # TRUNCATE empties every table at once instead of deleting row by row;
+    # CASCADE also clears any other table referencing them.
+    # Every other table hangs off users through NOT NULL foreign keys, so an
+    # empty users table means there is nothing to clean (fresh installs).
+    has_users = conn.execute(text("SELECT EXISTS (SELECT 1 FROM users)")).scalar()
+    if has_users:
+        conn.execute(text(
+            "TRUNCATE report_signatures, report_checklist_responses, "
+            "report_info_values, report_photos, reports, users CASCADE"
+        ))
 
     # Step 2: Make tenant_id nullable (for superadmin users)
     op.alter_column(
         'users',
         'tenant_id',
-        existing_type=sa.UUID(),
+        existing_type=UUID(as_uuid=True),
         nullable=True,
     )
 
@@ -60,28 +59,40 @@ def upgrade() -> None:
         "ALTER TABLE users DROP CONSTRAINT IF EXISTS ck_user_role_tenant_consistency"
     ))
 
-    # Step 4: Add CHECK constraint for role/tenant_id consistency
-    op.create_check_constraint(
-        'ck_user_role_tenant_consistency',
-        'users',
+    # Step 4: Add CHECK constraint for role/tenant_id consistency.
+    # NOT VALID attaches it without scanning users under the ACCESS EXCLUSIVE
+    # lock; VALIDATE then checks existing rows in its own transaction under
+    # SHARE UPDATE EXCLUSIVE, which does not block reads or writes.
+    conn.execute(text(
+        "ALTER TABLE users ADD CONSTRAINT ck_user_role_tenant_consistency CHECK ("
         "(role = 'superadmin' AND tenant_id IS NULL) OR "
         "(role != 'superadmin' AND tenant_id IS NOT NULL)"
-    )
+        ") NOT VALID"
+    ))
+    with op.get_context().autocommit_block():
+        conn.execute(text(
+            "ALTER TABLE users VALIDATE CONSTRAINT ck_user_role_tenant_consistency"
+        ))
 
 
 def downgrade() -> None:
     """Rollback - remove constraint and make tenant_id NOT NULL"""
-    try:
-        op.drop_constraint('ck_user_role_tenant_consistency', 'users', type_='check')
-    except Exception:
-        pass
+    conn = op.get_bind()
+
+    # Probe instead of try/except: a failed statement aborts the whole
+    # migration transaction, so swallowing the exception never worked.
+    conn.execute(text(
+        "ALTER TABLE users DROP CONSTRAINT IF EXISTS ck_user_role_tenant_consistency"
+    ))
 
-    try:
+    # Superadmins have no tenant; leave the column nullable while any exist
+    has_null_tenant = conn.execute(
+        text("SELECT EXISTS (SELECT 1 FROM users WHERE tenant_id IS NULL)")
+    ).scalar()
+    if not has_null_tenant:
         op.alter_column(
             'users',
             'tenant_id',
-            existing_type=sa.UUID(),
+            existing_type=UUID(as_uuid=True),
             nullable=False,
         )
-    except Exception:
-        pass
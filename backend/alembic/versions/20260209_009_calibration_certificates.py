@@ -4,25 +4,23 @@ Revision ID: 009
 Revises: 008
 Create Date: 2026-02-09
 """
-from typing import Sequence, Union
-
 from alembic import op
 import sqlalchemy as sa
 
 
-revision: str = '009'
-down_revision: Union[str, None] = '008'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
 
 
 def upgrade() -> None:
     op.create_table(
         'calibration_certificates',
-        sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', sa.Uuid(), server_default=sa.text('gen_random_uuid()'), nullable=False),
         sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
-        sa.Column('tenant_id', sa.UUID(), nullable=False),
+        sa.Column('tenant_id', sa.Uuid(), nullable=False),
         sa.Column('equipment_name', sa.String(255), nullable=False),
         sa.Column('certificate_number', sa.String(100), nullable=False),
         sa.Column('manufacturer', sa.String(255), nullable=True),
@@ -42,11 +40,11 @@ def upgrade() -> None:
 
     op.create_table(
         'report_certificates',
-        sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', sa.Uuid(), server_default=sa.text('gen_random_uuid()'), nullable=False),
         sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
-        sa.Column('report_id', sa.UUID(), sa.ForeignKey('reports.id', ondelete='CASCADE'), nullable=False),
-        sa.Column('certificate_id', sa.UUID(), sa.ForeignKey('calibration_certificates.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('report_id', sa.Uuid(), sa.ForeignKey('reports.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('certificate_id', sa.Uuid(), sa.ForeignKey('calibration_certificates.id', ondelete='CASCADE'), nullable=False),
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('report_id', 'certificate_id', name='uq_report_certificate'),
     )
@@ -4,24 +4,22 @@ Revision ID: 011
 Revises: 010
 Create Date: 2026-02-09
 """
-from typing import Sequence, Union
-
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import JSONB
 
 
-revision: str = '011'
-down_revision: Union[str, None] = '010'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
 
 
 def upgrade() -> None:
     # --- tenant_plans ---
     op.create_table(
         'tenant_plans',
-        sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', sa.Uuid(), server_default=sa.text('gen_random_uuid()'), nullable=False),
         sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
         sa.Column('name', sa.String(100), unique=True, nullable=False),
@@ -36,11 +34,11 @@ def upgrade() -> None:
     # --- tenant_configs ---
     op.create_table(
         'tenant_configs',
-        sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', sa.Uuid(), server_default=sa.text('gen_random_uuid()'), nullable=False),
         sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
-        sa.Column('tenant_id', sa.UUID(), sa.ForeignKey('tenants.id', ondelete='CASCADE'), unique=True, nullable=False),
-        sa.Column('plan_id', sa.UUID(), sa.ForeignKey('tenant_plans.id', ondelete='SET NULL'), nullable=True),
+        sa.Column('tenant_id', sa.Uuid(), sa.ForeignKey('tenants.id', ondelete='CASCADE'), unique=True, nullable=False),
+        sa.Column('plan_id', sa.Uuid(), sa.ForeignKey('tenant_plans.id', ondelete='SET NULL'), nullable=True),
         sa.Column('status', sa.String(20), nullable=False, server_default='trial'),
         sa.Column('contract_type', sa.String(50), nullable=True),
         sa.Column('limits_json', JSONB, server_default='{}', nullable=False),
@@ -56,11 +54,11 @@ def upgrade() -> None:
     # --- tenant_audit_logs ---
     op.create_table(
         'tenant_audit_logs',
-        sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', sa.Uuid(), server_default=sa.text('gen_random_uuid()'), nullable=False),
         sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
-        sa.Column('tenant_id', sa.UUID(), sa.ForeignKey('tenants.id', ondelete='CASCADE'), nullable=False),
-        sa.Column('admin_user_id', sa.UUID(), sa.ForeignKey('users.id', ondelete='RESTRICT'), nullable=False),
+        sa.Column('tenant_id', sa.Uuid(), sa.ForeignKey('tenants.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('admin_user_id', sa.Uuid(), sa.ForeignKey('users.id', ondelete='RESTRICT'), nullable=False),
         sa.Column('action', sa.String(100), nullable=False),
         sa.Column('old_values', JSONB, nullable=True),
         sa.Column('new_values', JSONB, nullable=True),
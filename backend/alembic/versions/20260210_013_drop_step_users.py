@@ -7,21 +7,19 @@ Revision ID: 013
 Revises: 012
 Create Date: 2026-02-10
 """
-from typing import Sequence, Union
-
 from alembic import op
 import sqlalchemy as sa
 
 
-revision: str = '013'
-down_revision: Union[str, None] = '012'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
 
 
 def upgrade() -> None:
-    # Mark any existing pending step_users as skipped so is_completed logic works
-    op.execute("UPDATE tenant_onboardings SET step_users = 'skipped' WHERE step_users = 'pending'")
+    # is_completed is stored on the row, so step_users can be dropped as is;
+    # rewriting it first would only leave dead tuples behind.
     op.drop_column('tenant_onboardings', 'step_users')
 
 
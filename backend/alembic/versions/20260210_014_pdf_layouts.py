@@ -7,17 +7,15 @@ Revision ID: 014
 Revises: 013
 Create Date: 2026-02-10
 """
-from typing import Sequence, Union
-
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import JSONB
 
 
-revision: str = '014'
-down_revision: Union[str, None] = '013'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
 
 
 def upgrade() -> None:
@@ -40,29 +38,28 @@ def upgrade() -> None:
     )
     op.create_index('ix_pdf_layouts_tenant_id', 'pdf_layouts', ['tenant_id'])
 
-    # 2. Add default_pdf_layout_id to tenants
-    op.add_column(
-        'tenants',
-        sa.Column('default_pdf_layout_id', sa.Uuid(), nullable=True),
-    )
-    op.create_foreign_key(
-        'fk_tenants_default_pdf_layout',
-        'tenants', 'pdf_layouts',
-        ['default_pdf_layout_id'], ['id'],
-        ondelete='SET NULL',
-    )
-
-    # 3. Add pdf_layout_id to templates
-    op.add_column(
-        'templates',
-        sa.Column('pdf_layout_id', sa.Uuid(), nullable=True),
+    # 2./3. Add default_pdf_layout_id to tenants and pdf_layout_id to
+    # templates. Each FK is attached NOT VALID together with its column, so
+    # neither table is scanned while holding the ALTER TABLE lock; the
+    # VALIDATE below runs outside the migration transaction under SHARE
+    # UPDATE EXCLUSIVE, which lets reads and writes continue.
+    op.execute(
+        "ALTER TABLE tenants "
+        "ADD COLUMN default_pdf_layout_id UUID, "
+        "ADD CONSTRAINT fk_tenants_default_pdf_layout "
+        "FOREIGN KEY (default_pdf_layout_id) REFERENCES pdf_layouts (id) "
+        "ON DELETE SET NULL NOT VALID"
     )
-    op.create_foreign_key(
-        'fk_templates_pdf_layout',
-        'templates', 'pdf_layouts',
-        ['pdf_layout_id'], ['id'],
-        ondelete='SET NULL',
+    op.execute(
+        "ALTER TABLE templates "
+        "ADD COLUMN pdf_layout_id UUID, "
+        "ADD CONSTRAINT fk_templates_pdf_layout "
+        "FOREIGN KEY (pdf_layout_id) REFERENCES pdf_layouts (id) "
+        "ON DELETE SET NULL NOT VALID"
     )
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE tenants VALIDATE CONSTRAINT fk_tenants_default_pdf_layout")
+        op.execute("ALTER TABLE templates VALIDATE CONSTRAINT fk_templates_pdf_layout")
 
 
 def downgrade() -> None:
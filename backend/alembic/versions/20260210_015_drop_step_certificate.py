@@ -8,21 +8,19 @@ Revision ID: 015
 Revises: 014
 Create Date: 2026-02-10
 """
-from typing import Sequence, Union
-
 from alembic import op
 import sqlalchemy as sa
 
 
-revision: str = '015'
-down_revision: Union[str, None] = '014'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
 
 
 def upgrade() -> None:
-    # Mark any existing pending step_certificate as skipped so is_completed logic works
-    op.execute("UPDATE tenant_onboardings SET step_certificate = 'skipped' WHERE step_certificate = 'pending'")
+    # is_completed is stored on the row, so step_certificate can be dropped as is;
+    # rewriting it first would only leave dead tuples behind.
     op.drop_column('tenant_onboardings', 'step_certificate')
 
 
@@ -10,16 +10,14 @@ Revision ID: 017
 Revises: 016
 Create Date: 2026-02-12
 """
-from typing import Sequence, Union
-
 from alembic import op
 import sqlalchemy as sa
 
 
-revision: str = '017'
-down_revision: Union[str, None] = '016'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
 
 
 def upgrade() -> None:
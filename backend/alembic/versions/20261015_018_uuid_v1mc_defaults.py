@@ -0,0 +1,66 @@
+"""Use time-ordered uuid_generate_v1mc() for primary key defaults
+
+Random v4 UUIDs from gen_random_uuid() land at random positions in the
+primary key B-tree, splitting leaf pages all over the index. v1mc UUIDs
+are timestamp based (with a random MAC), so consecutive inserts cluster
+near the same leaf pages.
+
+Requires the uuid-ossp extension, which is created here if missing.
+
+The ORM supplies its own time-ordered ids (uuid7() in app.models.base), so
+this default only applies to rows inserted with raw SQL.
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+
+TABLES = (
+    'tenants',
+    'users',
+    'projects',
+    'templates',
+    'template_sections',
+    'template_fields',
+    'template_info_fields',
+    'template_signature_fields',
+    'reports',
+    'report_photos',
+    'report_info_values',
+    'report_checklist_responses',
+    'report_signatures',
+    'calibration_certificates',
+    'report_certificates',
+    'tenant_plans',
+    'tenant_configs',
+    'tenant_audit_logs',
+    'tenant_onboardings',
+    'pdf_layouts',
+)
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"')
+    for table in TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT uuid_generate_v1mc()"
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        if table == 'report_signatures':
+            # Created without a server default in 006
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+        else:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()"
+            )
@@ -0,0 +1,63 @@
+"""Replace single-column report indexes with partial / covering ones
+
+- ix_reports_status: dropped. A handful of distinct values makes it
+  nearly useless on its own, and tenant-scoped status filters are served
+  by ix_reports_tenant_status_updated (016).
+- ix_reports_tenant_id: dropped. It is the leftmost prefix of
+  ix_reports_tenant_status_updated and adds nothing but write cost.
+- ix_reports_tenant_created: (tenant_id, created_at DESC) INCLUDE (status),
+  so the dashboard's per-month count over the last 12 months is an
+  index-only range scan, and date-ranged scans can check status without
+  visiting the table. The dashboard's status / template / user / project
+  breakdown is not covered: it also reads template_snapshot, user_id and
+  project_id, which stay in the table.
+- ix_reports_open: partial index over reports still being worked on
+  (draft / in_progress), which stays small as completed reports pile up.
+
+Built and dropped CONCURRENTLY so report writes aren't blocked meanwhile.
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+revision = '019'
+down_revision = '018'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    (
+        'ix_reports_tenant_created',
+        'ON reports (tenant_id, created_at DESC) INCLUDE (status)',
+    ),
+    (
+        'ix_reports_open',
+        "ON reports (tenant_id) WHERE status IN ('draft', 'in_progress')",
+    ),
+)
+
+REPLACED_INDEXES = (
+    ('ix_reports_status', 'ON reports (status)'),
+    ('ix_reports_tenant_id', 'ON reports (tenant_id)'),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, definition in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}")
+        for name, _definition in REPLACED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, definition in REPLACED_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}")
+        for name, _definition in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
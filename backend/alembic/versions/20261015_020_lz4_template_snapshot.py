@@ -0,0 +1,32 @@
+"""Compress reports.template_snapshot with lz4
+
+template_snapshot is a full copy of the template taken for every report,
+large enough to be TOASTed. lz4 decompresses several times faster than
+the default pglz, which every report read and PDF render pays for.
+
+Only values written after this migration use lz4; existing rows keep
+pglz until they are rewritten. Requires PostgreSQL 14+ built with lz4.
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+revision = '020'
+down_revision = '019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE reports ALTER COLUMN template_snapshot SET COMPRESSION lz4"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE reports ALTER COLUMN template_snapshot SET COMPRESSION pglz"
+    )
@@ -0,0 +1,53 @@
+"""Collapse report_id / tenant_id index pairs on report child tables
+
+report_photos and report_signatures each carry separate single-column
+indexes on report_id and tenant_id. Every insert maintains both, while
+the tenant_id one is never used on its own (rows are always reached
+through their report). Replace each pair with one (report_id, tenant_id)
+index: report_id stays leftmost so FK cascades from reports keep an
+index, and tenant-scoped lookups are answered by the same scan.
+
+report_info_values and report_checklist_responses have no tenant_id
+column and keep their report_id index.
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+revision = '021'
+down_revision = '020'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ('report_photos', 'report_signatures')
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block. Each table gets its
+    # new index before losing the old ones, so report_id is always indexed.
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_report_tenant "
+                f"ON {table} (report_id, tenant_id)"
+            )
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_report_id")
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_tenant_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_tenant_id "
+                f"ON {table} (tenant_id)"
+            )
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_report_id "
+                f"ON {table} (report_id)"
+            )
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_report_tenant")
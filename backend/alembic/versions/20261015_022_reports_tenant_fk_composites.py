@@ -0,0 +1,57 @@
+"""Replace report template/project FK indexes with tenant-leading composites
+
+Reports are always read within a tenant: list filtered by template,
+dashboard grouped by template / project. (tenant_id, template_id) and
+(tenant_id, project_id) answer those with a single index range instead
+of combining two single-column indexes.
+
+Templates and projects are deactivated, never hard-deleted, so the
+RESTRICT FKs on those columns don't need an FK-leading index.
+ix_reports_user_id is kept as is: users are hard-deleted and the RESTRICT
+check on reports.user_id must look up by user_id alone.
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+revision = '022'
+down_revision = '021'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ('ix_reports_tenant_template', 'reports', 'tenant_id, template_id'),
+    ('ix_reports_tenant_project', 'reports', 'tenant_id, project_id'),
+)
+
+REPLACED_INDEXES = (
+    ('ix_reports_template_id', 'reports', 'template_id'),
+    ('ix_reports_project_id', 'reports', 'project_id'),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} ({columns})"
+            )
+        for name, _table, _columns in REPLACED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} ({columns})"
+            )
+        for name, _table, _columns in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,41 @@
+"""Lower fillfactor on frequently updated report tables
+
+report_checklist_responses (response_value / comment / photos) and
+report_info_values (value) are updated many times per report. With the
+default fillfactor of 100 pages are packed full, so a new row version
+can't stay on its page and every update also writes new entries to all
+of the table's indexes. None of those columns is indexed, so leaving 30%
+free space per page keeps these updates HOT (heap-only).
+
+reports is updated on every save too. Its updated_at is indexed, so those
+updates can't be HOT, but the free space still keeps new row versions on
+the same page instead of extending the table.
+
+Only pages written after this migration honor the new setting; existing
+pages are repacked the next time the table is rewritten (VACUUM FULL /
+pg_repack).
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+revision = '023'
+down_revision = '022'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ('reports', 'report_checklist_responses', 'report_info_values')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = 70)")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
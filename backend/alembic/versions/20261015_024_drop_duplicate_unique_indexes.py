@@ -0,0 +1,48 @@
+"""Drop plain indexes that duplicate UNIQUE constraints
+
+Migration 001 declared UniqueConstraint('slug') / ('email') / ('file_key')
+and, on the same columns, a separate non-unique index. The unique
+constraint is already backed by its own B-tree, so the extra index is a
+second copy of it that every insert and update has to maintain:
+
+- ix_tenants_slug            (tenants_slug_key)
+- ix_users_email             (users_email_key)
+- ix_report_photos_file_key  (report_photos_file_key_key)
+
+Indexes are dropped / recreated CONCURRENTLY so live traffic on these
+tables is not blocked.
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+revision = '024'
+down_revision = '023'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ('ix_tenants_slug', 'tenants', 'slug'),
+    ('ix_users_email', 'users', 'email'),
+    ('ix_report_photos_file_key', 'report_photos', 'file_key'),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, _table, _column in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} ({column})"
+            )
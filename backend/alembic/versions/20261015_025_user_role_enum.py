@@ -0,0 +1,57 @@
+"""Store users.role as a native user_role enum
+
+users.role was VARCHAR(50) guarded by ck_user_role_tenant_consistency,
+which string-compares role on every insert/update. A PostgreSQL enum
+stores each value in 4 bytes, compares by sort order instead of by
+collation, and restricts the column to the known roles at the type
+level.
+
+Column type, default and check constraint are changed in a single
+ALTER TABLE so users is rewritten only once. The constraint is
+re-created rather than left to be rebuilt by the type change, which
+would keep the old role::text comparison.
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+revision = '025'
+down_revision = '024'
+branch_labels = None
+depends_on = None
+
+
+ROLES = ('superadmin', 'tenant_admin', 'project_manager', 'technician', 'viewer')
+
+CHECK = (
+    "(role = 'superadmin' AND tenant_id IS NULL) OR "
+    "(role != 'superadmin' AND tenant_id IS NOT NULL)"
+)
+
+
+def upgrade() -> None:
+    values = ", ".join(f"'{role}'" for role in ROLES)
+    op.execute(f"CREATE TYPE user_role AS ENUM ({values})")
+    op.execute(
+        "ALTER TABLE users "
+        "DROP CONSTRAINT IF EXISTS ck_user_role_tenant_consistency, "
+        "ALTER COLUMN role DROP DEFAULT, "
+        "ALTER COLUMN role TYPE user_role USING role::user_role, "
+        "ALTER COLUMN role SET DEFAULT 'technician', "
+        f"ADD CONSTRAINT ck_user_role_tenant_consistency CHECK ({CHECK})"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE users "
+        "DROP CONSTRAINT IF EXISTS ck_user_role_tenant_consistency, "
+        "ALTER COLUMN role DROP DEFAULT, "
+        "ALTER COLUMN role TYPE VARCHAR(50) USING role::text, "
+        "ALTER COLUMN role SET DEFAULT 'technician', "
+        f"ADD CONSTRAINT ck_user_role_tenant_consistency CHECK ({CHECK})"
+    )
+    op.execute("DROP TYPE IF EXISTS user_role")
@@ -0,0 +1,43 @@
+"""Defer checklist response FKs to template sections/fields
+
+report_checklist_responses rows are inserted in bulk when a report is
+created (one per template field). The section_id / field_id FKs only
+point back at the template the report was created from, so checking
+them at COMMIT instead of after every INSERT is safe, and it lets the
+whole batch go through before the checks run.
+
+The report_id FK stays immediate.
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+revision = '026'
+down_revision = '025'
+branch_labels = None
+depends_on = None
+
+
+CONSTRAINTS = (
+    'fk_report_checklist_responses_section_id',
+    'fk_report_checklist_responses_field_id',
+)
+
+
+def upgrade() -> None:
+    clauses = ", ".join(
+        f"ALTER CONSTRAINT {name} DEFERRABLE INITIALLY DEFERRED"
+        for name in CONSTRAINTS
+    )
+    op.execute(f"ALTER TABLE report_checklist_responses {clauses}")
+
+
+def downgrade() -> None:
+    clauses = ", ".join(
+        f"ALTER CONSTRAINT {name} NOT DEFERRABLE INITIALLY IMMEDIATE"
+        for name in CONSTRAINTS
+    )
+    op.execute(f"ALTER TABLE report_checklist_responses {clauses}")
@@ -0,0 +1,47 @@
+"""Index referencing columns of FKs that had no index
+
+Deleting (or re-keying) a referenced row makes PostgreSQL look up every
+referencing row to apply ON DELETE. Without an index on the referencing
+column that lookup is a sequential scan of the child table, once per
+deleted parent row:
+
+- tenants.default_pdf_layout_id -> pdf_layouts (SET NULL)
+- templates.pdf_layout_id       -> pdf_layouts (SET NULL)
+- tenant_audit_logs.admin_user_id -> users (RESTRICT)
+
+All other FK columns added in 009 / 011 / 014 / 017 already have one.
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+revision = '027'
+down_revision = '026'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ('ix_tenants_default_pdf_layout_id', 'tenants', 'default_pdf_layout_id'),
+    ('ix_templates_pdf_layout_id', 'templates', 'pdf_layout_id'),
+    ('ix_tenant_audit_logs_admin_user_id', 'tenant_audit_logs', 'admin_user_id'),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} ({column})"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _table, _column in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,38 @@
+"""Index only revision rows on reports.parent_report_id
+
+parent_report_id is NULL for every original report; only revisions set
+it. The full index from 017 stores an entry for every report anyway.
+Revision-chain lookups (parent_report_id IN (...)) and the SET NULL FK
+check both look for non-NULL values, so a partial index over revisions
+answers them at a fraction of the size.
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+revision = '028'
+down_revision = '027'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_reports_revision_parent "
+            "ON reports (parent_report_id) WHERE parent_report_id IS NOT NULL"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_reports_parent_report_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_reports_parent_report_id "
+            "ON reports (parent_report_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_reports_revision_parent")
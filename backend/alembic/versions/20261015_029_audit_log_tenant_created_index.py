@@ -0,0 +1,39 @@
+"""Index tenant audit logs in the order the SuperAdmin UI reads them
+
+The audit log endpoint lists a tenant's entries newest first
+(WHERE tenant_id = ? ORDER BY created_at DESC LIMIT/OFFSET). With only
+ix_tenant_audit_logs_tenant_id, every page fetches all of the tenant's
+entries and sorts them. (tenant_id, created_at DESC) returns each page
+straight from the index, and still covers the tenants FK cascade, so
+the single-column index is dropped.
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+revision = '029'
+down_revision = '028'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tenant_audit_logs_tenant_created "
+            "ON tenant_audit_logs (tenant_id, created_at DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tenant_audit_logs_tenant_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tenant_audit_logs_tenant_id "
+            "ON tenant_audit_logs (tenant_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tenant_audit_logs_tenant_created")
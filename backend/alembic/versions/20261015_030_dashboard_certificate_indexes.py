@@ -0,0 +1,68 @@
+"""Composite indexes for the per-user dashboard and the certificate list
+
+- ix_reports_tenant_user: the dashboard groups one tenant's reports by
+  user_id. Status, month, template and project already have
+  (tenant_id, ...) indexes; user_id only had its single-column FK index.
+  ix_reports_user_id stays for the users FK check.
+- ix_calibration_certificates_tenant_active_expiry: the certificate list
+  filters by tenant_id and is_active and orders by expiry_date, as do the
+  dashboard's expiring/expired counts. It replaces the tenant_id-only
+  index, which is its leading column.
+
+ix_calibration_certificates_certificate_number is dropped: lookups by
+number are always tenant-scoped and use uq_tenant_certificate_number, and
+the list search is ILIKE '%...%', which a B-tree can't serve.
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+
+revision = '030'
+down_revision = '029'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ('ix_reports_tenant_user', 'reports', 'tenant_id, user_id'),
+    (
+        'ix_calibration_certificates_tenant_active_expiry',
+        'calibration_certificates',
+        'tenant_id, is_active, expiry_date',
+    ),
+)
+
+REPLACED_INDEXES = (
+    ('ix_calibration_certificates_tenant_id', 'calibration_certificates', 'tenant_id'),
+    (
+        'ix_calibration_certificates_certificate_number',
+        'calibration_certificates',
+        'certificate_number',
+    ),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} ({columns})"
+            )
+        for name, _table, _columns in REPLACED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} ({columns})"
+            )
+        for name, _table, _columns in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -2,30 +2,49 @@
 Authentication endpoints: login, logout, refresh, and user info.
 """
 
+import secrets
 from typing import Annotated
 
-from fastapi import APIRouter, Cookie, Depends, HTTPException, Request, Response, status
+from fastapi import APIRouter, Cookie, Depends, Form, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.concurrency import run_in_threadpool
 
 from app.core.database import get_db
-from app.core.deps import get_current_user
+from app.core.deps import USER_BY_ID_STMT, get_current_user
+from app.core.rate_limit import limiter
 from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    verify_password,
+    hash_password,
+    verify_password_async,
 )
 from app.models.user import User
 from app.schemas.user import UserResponse, UserWithToken
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
-limiter = Limiter(key_func=get_remote_address)
+
+# Argon2 hash verified against when the email is unknown. Computed once at
+# import so the first failed login doesn't hash on the event loop.
+_DUMMY_PASSWORD_HASH = hash_password(secrets.token_urlsafe(16))
+
+USER_BY_EMAIL_STMT = select(User).where(User.email == bindparam("email"))
+
+
+async def password_form(
+    username: Annotated[str, Form()],
+    password: Annotated[str, Form()],
+) -> OAuth2PasswordRequestForm:
+    """
+    Parse the OAuth2 password form.
+
+    Depending on the OAuth2PasswordRequestForm class directly makes FastAPI
+    build it in the threadpool (class dependencies are sync callables); this
+    async dependency reads the same form fields on the event loop.
+    """
+    return OAuth2PasswordRequestForm(username=username, password=password)
 
 
 @router.post("/login", response_model=UserWithToken)
@@ -33,7 +52,7 @@ limiter = Limiter(key_func=get_remote_address)
 async def login(
     request: Request,
     response: Response,
-    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends(password_form)],
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -45,15 +64,21 @@ async def login(
     Rate limited to 5 requests per minute per IP.
     """
     # Find user by email (form_data.username is the email)
-    result = await db.execute(
-        select(User).where(User.email == form_data.username)
-    )
+    result = await db.execute(USER_BY_EMAIL_STMT, {"email": form_data.username})
     user = result.scalar_one_or_none()
 
-    if not user:
+    # Verify password off the event loop (CPU-intensive Argon2). Unknown
+    # emails are checked against a dummy hash so the response time and
+    # message don't reveal whether the account exists.
+    is_valid = await verify_password_async(
+        form_data.password,
+        user.password_hash if user else _DUMMY_PASSWORD_HASH,
+    )
+
+    if user is None or not is_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Email nao encontrado",
+            detail="Email ou senha incorretos",
         )
 
     if not user.is_active:
@@ -62,17 +87,6 @@ async def login(
             detail="Usuario inativo",
         )
 
-    # Verify password in thread pool (CPU-intensive Argon2)
-    is_valid = await run_in_threadpool(
-        verify_password, form_data.password, user.password_hash
-    )
-
-    if not is_valid:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Senha incorreta",
-        )
-
     # Create tokens with user claims
     # tenant_id can be None for superadmin users
     token_data = {
@@ -140,7 +154,7 @@ async def refresh_tokens(
         )
 
     # Get user from database
-    result = await db.execute(select(User).where(User.id == user_id))
+    result = await db.execute(USER_BY_ID_STMT, {"user_id": user_id})
     user = result.scalar_one_or_none()
 
     if not user or not user.is_active:
@@ -10,36 +10,80 @@ Provides CRUD operations for calibration certificates with:
 - Upload PDF file
 """
 
-import io
+import logging
 import uuid
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, UploadFile, status
 from sqlalchemy import select, func, and_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
 from app.core.database import get_db
-from app.core.deps import get_current_user, get_tenant_filter, require_role
+from app.core.deps import AuthContext, require_auth_context
 from app.models.calibration_certificate import CalibrationCertificate
-from app.models.user import User
 from app.schemas.certificate import (
     CertificateCreate,
     CertificateUpdate,
     CertificateResponse,
     CertificateListResponse,
 )
-from app.services.storage import get_storage_service, StorageError
+from app.services.storage import get_storage_service, StorageError, StorageService
 
 router = APIRouter(prefix="/certificates", tags=["certificates"])
 
+# Readers: any authenticated user. Managers: may create and change certificates.
+CertificateReader = Annotated[AuthContext, Depends(require_auth_context())]
+CertificateManager = Annotated[
+    AuthContext, Depends(require_auth_context("tenant_admin", "superadmin"))
+]
+
+logger = logging.getLogger(__name__)
+
+# Columns read by the list endpoint: exactly the CertificateResponse fields,
+# so rows can be built into responses without loading ORM entities
+LIST_COLUMNS = tuple(
+    getattr(CalibrationCertificate, name) for name in CertificateResponse.model_fields
+)
+
+# Enforces unique certificate numbers per tenant (migration 009)
+CERTIFICATE_NUMBER_CONSTRAINT = "uq_tenant_certificate_number"
+
+
+async def _commit_certificate(db: AsyncSession, certificate_number: str) -> None:
+    """
+    Commit, turning a duplicate certificate number into a 409.
+
+    The unique constraint is checked by the INSERT/UPDATE itself, so there is
+    no separate lookup and no window for two concurrent requests to both pass
+    a pre-check.
+    """
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        diag = getattr(exc.orig, "diag", None)
+        if getattr(diag, "constraint_name", None) != CERTIFICATE_NUMBER_CONSTRAINT:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Certificado com numero '{certificate_number}' ja existe neste tenant",
+        ) from exc
+
+
+def _delete_replaced_file(storage: StorageService, file_key: str) -> None:
+    """Remove a certificate file superseded by a new upload."""
+    if not storage.delete_object(file_key):
+        logger.warning("Could not delete replaced certificate file %s", file_key)
+
 
 @router.post("/", response_model=CertificateResponse, status_code=status.HTTP_201_CREATED)
 async def create_certificate(
     data: CertificateCreate,
+    auth: CertificateManager,
     db: AsyncSession = Depends(get_db),
-    current_user: Annotated[User, Depends(require_role("tenant_admin", "superadmin"))] = None,
-    tenant_id: UUID | None = Depends(get_tenant_filter),
 ):
     """
     Create a new calibration certificate.
@@ -47,29 +91,14 @@ async def create_certificate(
     Requires tenant_admin or superadmin role.
     Superadmin must specify tenant_id via query parameter.
     """
-    if tenant_id is None:
+    if auth.tenant_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Superadmin deve especificar tenant_id na query (?tenant_id=...)",
         )
 
-    # Check for duplicate certificate_number within the tenant
-    existing = await db.execute(
-        select(CalibrationCertificate).where(
-            and_(
-                CalibrationCertificate.tenant_id == tenant_id,
-                CalibrationCertificate.certificate_number == data.certificate_number,
-            )
-        )
-    )
-    if existing.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Certificado com numero '{data.certificate_number}' ja existe neste tenant",
-        )
-
     certificate = CalibrationCertificate(
-        tenant_id=tenant_id,
+        tenant_id=auth.tenant_id,
         equipment_name=data.equipment_name,
         certificate_number=data.certificate_number,
         manufacturer=data.manufacturer,
@@ -81,7 +110,7 @@ async def create_certificate(
         status=data.status,
     )
     db.add(certificate)
-    await db.commit()
+    await _commit_certificate(db, data.certificate_number)
     await db.refresh(certificate)
 
     return CertificateResponse.model_validate(certificate)
@@ -89,9 +118,8 @@ async def create_certificate(
 
 @router.get("/", response_model=CertificateListResponse)
 async def list_certificates(
+    auth: CertificateReader,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-    tenant_id: UUID | None = Depends(get_tenant_filter),
     search: str | None = Query(None, description="Search by equipment name or certificate number"),
     status_filter: str | None = Query(None, alias="status", description="Filter by status"),
     active_only: bool = Query(True, description="Show only active certificates"),
@@ -104,8 +132,8 @@ async def list_certificates(
     Supports search, status filter, and pagination.
     """
     conditions = []
-    if tenant_id is not None:
-        conditions.append(CalibrationCertificate.tenant_id == tenant_id)
+    if auth.tenant_id is not None:
+        conditions.append(CalibrationCertificate.tenant_id == auth.tenant_id)
 
     if active_only:
         conditions.append(CalibrationCertificate.is_active == True)
@@ -120,24 +148,36 @@ async def list_certificates(
             | CalibrationCertificate.certificate_number.ilike(search_term)
         )
 
-    # Count total
-    count_query = select(func.count(CalibrationCertificate.id)).where(and_(*conditions))
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Get certificates
+    # Get the page and the total in one round-trip: count(*) OVER () is
+    # computed before OFFSET/LIMIT, so every returned row carries the total
     query = (
-        select(CalibrationCertificate)
-        .where(and_(*conditions))
+        select(*LIST_COLUMNS, func.count().over().label("total"))
+        .where(*conditions)
         .order_by(CalibrationCertificate.expiry_date.asc())
         .offset(skip)
         .limit(limit)
     )
     result = await db.execute(query)
-    certificates = result.scalars().all()
-
+    rows = result.mappings().all()
+
+    if rows:
+        total = rows[0]["total"]
+    elif skip == 0:
+        total = 0
+    else:
+        # Page past the end: no row to read the total from
+        count_query = select(func.count()).select_from(CalibrationCertificate).where(*conditions)
+        total_result = await db.execute(count_query)
+        total = total_result.scalar() or 0
+
+    # Values come straight from typed columns, so they are not re-validated
     return CertificateListResponse(
-        certificates=[CertificateResponse.model_validate(c) for c in certificates],
+        certificates=[
+            CertificateResponse.model_construct(
+                **{column.key: row[column.key] for column in LIST_COLUMNS}
+            )
+            for row in rows
+        ],
         total=total,
     )
 
@@ -145,14 +185,13 @@ async def list_certificates(
 @router.get("/{certificate_id}", response_model=CertificateResponse)
 async def get_certificate(
     certificate_id: UUID,
+    auth: CertificateReader,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-    tenant_id: UUID | None = Depends(get_tenant_filter),
 ):
     """Get a calibration certificate by ID."""
     conditions = [CalibrationCertificate.id == certificate_id]
-    if tenant_id is not None:
-        conditions.append(CalibrationCertificate.tenant_id == tenant_id)
+    if auth.tenant_id is not None:
+        conditions.append(CalibrationCertificate.tenant_id == auth.tenant_id)
 
     result = await db.execute(
         select(CalibrationCertificate).where(and_(*conditions))
@@ -172,9 +211,8 @@ async def get_certificate(
 async def update_certificate(
     certificate_id: UUID,
     data: CertificateUpdate,
+    auth: CertificateManager,
     db: AsyncSession = Depends(get_db),
-    current_user: Annotated[User, Depends(require_role("tenant_admin", "superadmin"))] = None,
-    tenant_id: UUID | None = Depends(get_tenant_filter),
 ):
     """
     Update a calibration certificate.
@@ -182,8 +220,8 @@ async def update_certificate(
     Requires tenant_admin or superadmin role.
     """
     conditions = [CalibrationCertificate.id == certificate_id]
-    if tenant_id is not None:
-        conditions.append(CalibrationCertificate.tenant_id == tenant_id)
+    if auth.tenant_id is not None:
+        conditions.append(CalibrationCertificate.tenant_id == auth.tenant_id)
 
     result = await db.execute(
         select(CalibrationCertificate).where(and_(*conditions))
@@ -196,28 +234,11 @@ async def update_certificate(
             detail="Certificado nao encontrado",
         )
 
-    # Check for duplicate certificate_number if being changed
     update_data = data.model_dump(exclude_unset=True)
-    if "certificate_number" in update_data and update_data["certificate_number"] != certificate.certificate_number:
-        existing = await db.execute(
-            select(CalibrationCertificate).where(
-                and_(
-                    CalibrationCertificate.tenant_id == certificate.tenant_id,
-                    CalibrationCertificate.certificate_number == update_data["certificate_number"],
-                    CalibrationCertificate.id != certificate_id,
-                )
-            )
-        )
-        if existing.scalar_one_or_none():
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Certificado com numero '{update_data['certificate_number']}' ja existe neste tenant",
-            )
-
     for field, value in update_data.items():
         setattr(certificate, field, value)
 
-    await db.commit()
+    await _commit_certificate(db, certificate.certificate_number)
     await db.refresh(certificate)
 
     return CertificateResponse.model_validate(certificate)
@@ -226,9 +247,8 @@ async def update_certificate(
 @router.delete("/{certificate_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_certificate(
     certificate_id: UUID,
+    auth: CertificateManager,
     db: AsyncSession = Depends(get_db),
-    current_user: Annotated[User, Depends(require_role("tenant_admin", "superadmin"))] = None,
-    tenant_id: UUID | None = Depends(get_tenant_filter),
 ):
     """
     Soft delete a calibration certificate (set is_active=False).
@@ -236,8 +256,8 @@ async def delete_certificate(
     Requires tenant_admin or superadmin role.
     """
     conditions = [CalibrationCertificate.id == certificate_id]
-    if tenant_id is not None:
-        conditions.append(CalibrationCertificate.tenant_id == tenant_id)
+    if auth.tenant_id is not None:
+        conditions.append(CalibrationCertificate.tenant_id == auth.tenant_id)
 
     result = await db.execute(
         select(CalibrationCertificate).where(and_(*conditions))
@@ -259,10 +279,10 @@ async def delete_certificate(
 @router.post("/{certificate_id}/upload", response_model=CertificateResponse)
 async def upload_certificate_file(
     certificate_id: UUID,
+    background_tasks: BackgroundTasks,
+    auth: CertificateManager,
     file: UploadFile = File(..., description="Certificate PDF file"),
     db: AsyncSession = Depends(get_db),
-    current_user: Annotated[User, Depends(require_role("tenant_admin", "superadmin"))] = None,
-    tenant_id: UUID | None = Depends(get_tenant_filter),
 ):
     """
     Upload a PDF file for a calibration certificate.
@@ -278,8 +298,8 @@ async def upload_certificate_file(
         )
 
     conditions = [CalibrationCertificate.id == certificate_id]
-    if tenant_id is not None:
-        conditions.append(CalibrationCertificate.tenant_id == tenant_id)
+    if auth.tenant_id is not None:
+        conditions.append(CalibrationCertificate.tenant_id == auth.tenant_id)
 
     result = await db.execute(
         select(CalibrationCertificate).where(and_(*conditions))
@@ -292,22 +312,19 @@ async def upload_certificate_file(
             detail="Certificado nao encontrado",
         )
 
-    # Delete old file if exists
     storage = get_storage_service()
-    if certificate.file_key:
-        try:
-            storage.delete_object(certificate.file_key)
-        except Exception:
-            pass
+    old_file_key = certificate.file_key
 
-    # Upload new file
+    # Upload new file (boto3 is blocking, so keep it off the event loop)
     try:
         file_key = f"{certificate.tenant_id}/certificates/{certificate_id}/{file.filename or 'certificate.pdf'}"
-        content = await file.read()
-        file_obj = io.BytesIO(content)
+        # Stream the spooled upload straight to storage instead of
+        # copying it into memory first
+        await file.seek(0)
 
-        url, stored_key = storage.upload_photo(
-            file=file_obj,
+        url, stored_key = await run_in_threadpool(
+            storage.upload_photo,
+            file=file.file,
             tenant_id=str(certificate.tenant_id),
             report_id="certificates",
             response_id=str(certificate_id),
@@ -324,4 +341,9 @@ async def upload_certificate_file(
     await db.commit()
     await db.refresh(certificate)
 
+    # Remove the previous file only once the new one is committed, after
+    # the response is sent
+    if old_file_key and old_file_key != certificate.file_key:
+        background_tasks.add_task(_delete_replaced_file, storage, old_file_key)
+
     return CertificateResponse.model_validate(certificate)
@@ -11,13 +11,15 @@ Returns aggregated metrics for the current tenant:
 from datetime import datetime, timedelta
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from pydantic import BaseModel
-from sqlalchemy import select, func, and_, case, extract
+from sqlalchemy import select, func, extract, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.deps import get_current_user, get_tenant_filter
+from app.core.http_cache import cache_headers, etag_matches, make_etag, not_modified
+from app.models.project import Project
 from app.models.report import Report
 from app.models.report_photo import ReportPhoto
 from app.models.calibration_certificate import CalibrationCertificate
@@ -25,6 +27,40 @@ from app.models.user import User
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
+# Entries returned for the by-template / by-user / by-project breakdowns
+TOP_N = 10
+
+
+async def _dashboard_etag(db: AsyncSession, tenant_id: UUID | None) -> str:
+    """
+    Build an ETag from the latest write to every table the dashboard reads.
+
+    Reports and certificates are never hard-deleted, and photos only ever
+    added, so the newest timestamps change whenever any metric can. The date
+    is included because the expiry and 12-month windows move with it.
+    """
+    def latest(column, tenant_column):
+        query = select(func.max(column))
+        if tenant_id is not None:
+            query = query.where(tenant_column == tenant_id)
+        return query.scalar_subquery()
+
+    probe = select(
+        latest(Report.updated_at, Report.tenant_id),
+        latest(ReportPhoto.created_at, ReportPhoto.tenant_id),
+        latest(CalibrationCertificate.updated_at, CalibrationCertificate.tenant_id),
+        latest(User.updated_at, User.tenant_id),
+        latest(Project.updated_at, Project.tenant_id),
+    )
+    stamps = (await db.execute(probe)).one()
+
+    return make_etag(tenant_id, datetime.utcnow().date(), *stamps)
+
+
+def _top(rows: list) -> list:
+    """Return the TOP_N rows with the highest count."""
+    return sorted(rows, key=lambda row: row.count, reverse=True)[:TOP_N]
+
 
 # --- Response Schemas ---
 
@@ -69,109 +105,88 @@ class DashboardMetrics(BaseModel):
 
 @router.get("/metrics", response_model=DashboardMetrics)
 async def get_dashboard_metrics(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     tenant_id: UUID | None = Depends(get_tenant_filter),
 ):
     """
     Get aggregated dashboard metrics for the current tenant.
+
+    All queries run on the request's session, one connection per request:
+    the breakdowns share a single grouped scan, so only five aggregate
+    queries remain. Responses carry an ETag; a matching If-None-Match gets
+    a 304 after a single probe query instead of running the aggregates.
     """
+    etag = await _dashboard_etag(db, tenant_id)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    response.headers.update(cache_headers(etag))
+
     # Base condition for tenant filtering
     conditions = []
     if tenant_id is not None:
         conditions.append(Report.tenant_id == tenant_id)
 
-    # 1. Reports by status
-    status_query = (
-        select(Report.status, func.count(Report.id).label("count"))
-        .where(and_(*conditions) if conditions else True)
-        .group_by(Report.status)
-    )
-    status_result = await db.execute(status_query)
-    reports_by_status = [
-        StatusCount(status=row.status, count=row.count)
-        for row in status_result.all()
-    ]
-
-    # Total reports
-    total_reports = sum(s.count for s in reports_by_status)
-
-    # 2. Reports by month (last 12 months)
-    twelve_months_ago = datetime.utcnow() - timedelta(days=365)
-    month_conditions = list(conditions) + [Report.created_at >= twelve_months_ago]
-    month_query = (
-        select(
-            func.to_char(Report.created_at, 'YYYY-MM').label("month"),
-            func.count(Report.id).label("count"),
-        )
-        .where(and_(*month_conditions))
-        .group_by(func.to_char(Report.created_at, 'YYYY-MM'))
-        .order_by(func.to_char(Report.created_at, 'YYYY-MM'))
-    )
-    month_result = await db.execute(month_query)
-    reports_by_month = [
-        MonthCount(month=row.month, count=row.count)
-        for row in month_result.all()
-    ]
-
-    # 3. Reports by template (top 10)
-    template_query = (
+    # 1. Reports by status, template, user and project, plus the total, in
+    # a single scan: each grouping set aggregates the same filtered rows, and
+    # user/project names are joined onto the (small) aggregate instead of
+    # every report
+    scoped = (
         select(
+            Report.status,
             Report.template_snapshot['name'].astext.label("template_name"),
-            func.count(Report.id).label("count"),
+            Report.user_id,
+            Report.project_id,
         )
-        .where(and_(*conditions) if conditions else True)
-        .group_by(Report.template_snapshot['name'].astext)
-        .order_by(func.count(Report.id).desc())
-        .limit(10)
+        .where(*conditions)
+        .subquery("scoped")
     )
-    template_result = await db.execute(template_query)
-    reports_by_template = [
-        TemplateCount(template_name=row.template_name or "Sem nome", count=row.count)
-        for row in template_result.all()
-    ]
-
-    # 4. Reports by user (top 10)
-    from app.models.user import User as UserModel
-    user_query = (
+    grouped = (
         select(
-            Report.user_id,
-            UserModel.full_name.label("user_name"),
-            func.count(Report.id).label("count"),
+            scoped.c.status,
+            scoped.c.template_name,
+            scoped.c.user_id,
+            scoped.c.project_id,
+            # template_name is NULL for snapshots without a name, so it
+            # needs GROUPING() to tell its rows from the other sets
+            (func.grouping(scoped.c.template_name) == 0).label("by_template"),
+            func.count().label("count"),
         )
-        .join(UserModel, Report.user_id == UserModel.id)
-        .where(and_(*conditions) if conditions else True)
-        .group_by(Report.user_id, UserModel.full_name)
-        .order_by(func.count(Report.id).desc())
-        .limit(10)
+        .group_by(func.grouping_sets(
+            scoped.c.status,
+            scoped.c.template_name,
+            scoped.c.user_id,
+            scoped.c.project_id,
+            tuple_(),  # grand total
+        ))
+        .subquery("grouped")
     )
-    user_result = await db.execute(user_query)
-    reports_by_user = [
-        UserCount(user_id=str(row.user_id), user_name=row.user_name, count=row.count)
-        for row in user_result.all()
-    ]
-
-    # 5. Reports by project (top 10)
-    from app.models.project import Project
-    project_query = (
+    breakdown_query = (
         select(
-            Report.project_id,
+            grouped,
+            User.full_name.label("user_name"),
             Project.name.label("project_name"),
-            func.count(Report.id).label("count"),
         )
-        .join(Project, Report.project_id == Project.id)
-        .where(and_(*conditions) if conditions else True)
-        .group_by(Report.project_id, Project.name)
-        .order_by(func.count(Report.id).desc())
-        .limit(10)
+        .outerjoin(User, User.id == grouped.c.user_id)
+        .outerjoin(Project, Project.id == grouped.c.project_id)
+    )
+
+    # 2. Reports by month (last 12 months)
+    twelve_months_ago = datetime.utcnow() - timedelta(days=365)
+    month_conditions = list(conditions) + [Report.created_at >= twelve_months_ago]
+    # Grouped by the truncated timestamp and formatted in Python, rather
+    # than formatting every row with to_char before grouping
+    month_col = func.date_trunc('month', Report.created_at).label("month")
+    month_query = (
+        select(month_col, func.count().label("count"))
+        .where(*month_conditions)
+        .group_by(month_col)
+        .order_by(month_col)
     )
-    project_result = await db.execute(project_query)
-    reports_by_project = [
-        ProjectCount(project_id=str(row.project_id), project_name=row.project_name, count=row.count)
-        for row in project_result.all()
-    ]
 
-    # 6. Average completion time (draft -> completed)
+    # 3. Average completion time (draft -> completed)
     avg_query = (
         select(
             func.avg(
@@ -179,34 +194,27 @@ async def get_dashboard_metrics(
             ).label("avg_seconds")
         )
         .where(
-            and_(
-                *(conditions + [
-                    Report.status == 'completed',
-                    Report.started_at.isnot(None),
-                    Report.completed_at.isnot(None),
-                ])
-            )
+            *conditions,
+            Report.status == 'completed',
+            Report.started_at.isnot(None),
+            Report.completed_at.isnot(None),
         )
     )
-    avg_result = await db.execute(avg_query)
-    avg_seconds = avg_result.scalar()
-    avg_completion_hours = round(avg_seconds / 3600, 1) if avg_seconds else None
 
-    # 7. Total photos
+    # 4. Total photos
     photo_conditions = []
     if tenant_id is not None:
         # Photos are linked via report, so join
         photo_query = (
-            select(func.count(ReportPhoto.id))
+            select(func.count())
+            .select_from(ReportPhoto)
             .join(Report, ReportPhoto.report_id == Report.id)
             .where(Report.tenant_id == tenant_id)
         )
     else:
-        photo_query = select(func.count(ReportPhoto.id))
-    photo_result = await db.execute(photo_query)
-    total_photos = photo_result.scalar() or 0
+        photo_query = select(func.count()).select_from(ReportPhoto)
 
-    # 8. Certificate stats
+    # 5. Certificate stats
     cert_conditions = []
     if tenant_id is not None:
         cert_conditions.append(CalibrationCertificate.tenant_id == tenant_id)
@@ -215,37 +223,75 @@ async def get_dashboard_metrics(
     today = datetime.utcnow().date()
     thirty_days = today + timedelta(days=30)
 
-    cert_total_query = (
-        select(func.count(CalibrationCertificate.id))
-        .where(and_(*cert_conditions))
-    )
-    cert_total_result = await db.execute(cert_total_query)
-    cert_total = cert_total_result.scalar() or 0
-
-    cert_expiring_query = (
-        select(func.count(CalibrationCertificate.id))
-        .where(
-            and_(
-                *cert_conditions,
+    # Total, expiring and expired in one pass over the tenant's certificates
+    cert_query = (
+        select(
+            func.count().label("total"),
+            func.count()
+            .filter(
                 CalibrationCertificate.expiry_date > today,
                 CalibrationCertificate.expiry_date <= thirty_days,
             )
+            .label("expiring"),
+            func.count()
+            .filter(CalibrationCertificate.expiry_date <= today)
+            .label("expired"),
         )
+        .select_from(CalibrationCertificate)
+        .where(*cert_conditions)
     )
-    cert_expiring_result = await db.execute(cert_expiring_query)
-    cert_expiring = cert_expiring_result.scalar() or 0
 
-    cert_expired_query = (
-        select(func.count(CalibrationCertificate.id))
-        .where(
-            and_(
-                *cert_conditions,
-                CalibrationCertificate.expiry_date <= today,
-            )
-        )
-    )
-    cert_expired_result = await db.execute(cert_expired_query)
-    cert_expired = cert_expired_result.scalar() or 0
+    breakdown_rows = (await db.execute(breakdown_query)).all()
+    month_rows = (await db.execute(month_query)).all()
+    avg_rows = (await db.execute(avg_query)).all()
+    photo_rows = (await db.execute(photo_query)).all()
+    cert_rows = (await db.execute(cert_query)).all()
+
+    status_rows, template_rows, user_rows, project_rows = [], [], [], []
+    total_reports = 0
+    for row in breakdown_rows:
+        if row.by_template:
+            template_rows.append(row)
+        elif row.status is not None:
+            status_rows.append(row)
+        elif row.user_id is not None:
+            user_rows.append(row)
+        elif row.project_id is not None:
+            project_rows.append(row)
+        else:
+            total_reports = row.count
+
+    reports_by_status = [
+        StatusCount(status=row.status, count=row.count)
+        for row in status_rows
+    ]
+
+    reports_by_month = [
+        MonthCount(month=row.month.strftime("%Y-%m"), count=row.count)
+        for row in month_rows
+    ]
+    reports_by_template = [
+        TemplateCount(template_name=row.template_name or "Sem nome", count=row.count)
+        for row in _top(template_rows)
+    ]
+    reports_by_user = [
+        UserCount(user_id=str(row.user_id), user_name=row.user_name, count=row.count)
+        for row in _top(user_rows)
+    ]
+    reports_by_project = [
+        ProjectCount(project_id=str(row.project_id), project_name=row.project_name, count=row.count)
+        for row in _top(project_rows)
+    ]
+
+    avg_seconds = avg_rows[0].avg_seconds
+    avg_completion_hours = round(avg_seconds / 3600, 1) if avg_seconds else None
+
+    total_photos = photo_rows[0][0] or 0
+
+    cert_row = cert_rows[0]
+    cert_total = cert_row.total
+    cert_expiring = cert_row.expiring
+    cert_expired = cert_row.expired
 
     return DashboardMetrics(
         reports_by_status=reports_by_status,
@@ -1,9 +1,19 @@
-from fastapi import APIRouter
+import json
+
+from fastapi import APIRouter, Response
 
 from app.core.config import settings
 
 router = APIRouter(tags=["health"])
 
+# The payload never changes while the process runs; encode it once instead of
+# on every load balancer probe
+HEALTH_BODY = json.dumps({
+    "status": "ok",
+    "version": settings.app_version,
+    "app": settings.app_name
+}).encode()
+
 
 @router.get("/")
 async def health_check():
@@ -13,11 +23,7 @@ async def health_check():
     Returns application status, version, and name.
     Used by load balancers and monitoring systems.
     """
-    return {
-        "status": "ok",
-        "version": settings.app_version,
-        "app": settings.app_name
-    }
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
 @router.get("/health")
@@ -28,8 +34,4 @@ async def health():
     Returns same information as root endpoint.
     Provided for compatibility with different load balancers.
     """
-    return {
-        "status": "ok",
-        "version": settings.app_version,
-        "app": settings.app_name
-    }
+    return Response(content=HEALTH_BODY, media_type="application/json")
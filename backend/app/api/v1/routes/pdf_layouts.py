@@ -11,12 +11,13 @@ Provides CRUD operations for PDF layouts:
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select, func, or_, and_
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import exists, select, func, or_, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.deps import get_current_user, get_tenant_filter
+from app.core.http_cache import cache_headers, etag_matches, make_etag, not_modified
 from app.models.pdf_layout import PdfLayout
 from app.models.user import User
 from app.schemas.pdf_layout import (
@@ -25,13 +26,19 @@ from app.schemas.pdf_layout import (
     PdfLayoutResponse,
     PdfLayoutListResponse,
 )
-from app.services.feature_check import check_feature
+from app.services.feature_check import check_feature_cached
+from app.services.pdf_layout_cache import get_active_layouts, invalidate_tenant_layouts
 
 router = APIRouter(prefix="/pdf-layouts", tags=["pdf-layouts"])
 
+# PdfLayoutUpdate fields written by update_pdf_layout when provided
+UPDATABLE_FIELDS = ("name", "slug", "description", "config_json", "is_active")
+
 
 @router.get("/", response_model=PdfLayoutListResponse)
 async def list_pdf_layouts(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     tenant_id: UUID | None = Depends(get_tenant_filter),
@@ -40,25 +47,25 @@ async def list_pdf_layouts(
     List available PDF layouts.
 
     Returns system layouts (available to all) plus custom layouts
-    belonging to the current tenant.
+    belonging to the current tenant. Responses carry an ETag built from the
+    layouts' ids and update times; a matching If-None-Match gets a 304.
     """
-    conditions = [PdfLayout.is_active == True]
-
     if tenant_id is not None:
         # System layouts (no tenant) + this tenant's custom layouts
-        conditions.append(
-            or_(
-                PdfLayout.tenant_id.is_(None),
-                PdfLayout.tenant_id == tenant_id,
-            )
+        layouts = await get_active_layouts(db, tenant_id)
+    else:
+        # Superadmin without tenant: every active layout, uncached
+        result = await db.execute(
+            select(PdfLayout)
+            .where(PdfLayout.is_active == True)
+            .order_by(PdfLayout.is_system.desc(), PdfLayout.name)
         )
+        layouts = list(result.scalars().all())
 
-    result = await db.execute(
-        select(PdfLayout)
-        .where(and_(*conditions))
-        .order_by(PdfLayout.is_system.desc(), PdfLayout.name)
-    )
-    layouts = list(result.scalars().all())
+    etag = make_etag(*((layout.id, layout.updated_at) for layout in layouts))
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    response.headers.update(cache_headers(etag))
 
     return PdfLayoutListResponse(layouts=layouts, total=len(layouts))
 
@@ -71,6 +78,12 @@ async def get_pdf_layout(
     tenant_id: UUID | None = Depends(get_tenant_filter),
 ):
     """Get a PDF layout by ID."""
+    if tenant_id is not None:
+        # Active layouts are served from the cache; inactive ones fall through
+        for layout in await get_active_layouts(db, tenant_id):
+            if layout.id == layout_id:
+                return layout
+
     conditions = [PdfLayout.id == layout_id]
 
     if tenant_id is not None:
@@ -114,23 +127,23 @@ async def create_pdf_layout(
         )
 
     # Check feature flag
-    has_feature = await check_feature(db, tenant_id, "custom_pdf")
+    has_feature = await check_feature_cached(db, tenant_id, "custom_pdf")
     if not has_feature:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Recurso custom_pdf nao disponivel no plano atual",
         )
 
-    # Check slug uniqueness for this tenant
-    existing = await db.execute(
-        select(PdfLayout).where(
-            and_(
+    # Check slug uniqueness for this tenant (EXISTS: no row is loaded)
+    slug_taken = await db.scalar(
+        select(
+            exists().where(
                 PdfLayout.tenant_id == tenant_id,
                 PdfLayout.slug == data.slug,
             )
         )
     )
-    if existing.scalar_one_or_none():
+    if slug_taken:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Ja existe um layout com slug '{data.slug}' para este tenant",
@@ -147,7 +160,7 @@ async def create_pdf_layout(
     )
     db.add(layout)
     await db.commit()
-    await db.refresh(layout)
+    invalidate_tenant_layouts(tenant_id)
 
     return layout
 
@@ -171,58 +184,57 @@ async def update_pdf_layout(
             detail="Superadmin deve especificar tenant_id na query",
         )
 
-    has_feature = await check_feature(db, tenant_id, "custom_pdf")
+    has_feature = await check_feature_cached(db, tenant_id, "custom_pdf")
     if not has_feature:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Recurso custom_pdf nao disponivel no plano atual",
         )
 
-    result = await db.execute(
-        select(PdfLayout).where(
-            and_(
-                PdfLayout.id == layout_id,
-                PdfLayout.tenant_id == tenant_id,
-                PdfLayout.is_system == False,
-            )
-        )
-    )
-    layout = result.scalar_one_or_none()
-
-    if not layout:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Layout customizado nao encontrado",
-        )
-
-    if data.name is not None:
-        layout.name = data.name
     if data.slug is not None:
         # Check slug uniqueness
-        existing = await db.execute(
-            select(PdfLayout).where(
-                and_(
+        slug_taken = await db.scalar(
+            select(
+                exists().where(
                     PdfLayout.tenant_id == tenant_id,
                     PdfLayout.slug == data.slug,
                     PdfLayout.id != layout_id,
                 )
             )
         )
-        if existing.scalar_one_or_none():
+        if slug_taken:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"Ja existe um layout com slug '{data.slug}' para este tenant",
             )
-        layout.slug = data.slug
-    if data.description is not None:
-        layout.description = data.description
-    if data.config_json is not None:
-        layout.config_json = data.config_json
-    if data.is_active is not None:
-        layout.is_active = data.is_active
+
+    editable = and_(
+        PdfLayout.id == layout_id,
+        PdfLayout.tenant_id == tenant_id,
+        PdfLayout.is_system == False,
+    )
+    values = {
+        field: getattr(data, field)
+        for field in UPDATABLE_FIELDS
+        if getattr(data, field) is not None
+    }
+
+    # Update and read back the row in one statement (no SELECT first)
+    if values:
+        stmt = update(PdfLayout).where(editable).values(**values).returning(PdfLayout)
+    else:
+        stmt = select(PdfLayout).where(editable)
+    result = await db.execute(stmt)
+    layout = result.scalar_one_or_none()
+
+    if not layout:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Layout customizado nao encontrado",
+        )
 
     await db.commit()
-    await db.refresh(layout)
+    invalidate_tenant_layouts(tenant_id)
 
     return layout
 
@@ -245,7 +257,7 @@ async def delete_pdf_layout(
             detail="Superadmin deve especificar tenant_id na query",
         )
 
-    has_feature = await check_feature(db, tenant_id, "custom_pdf")
+    has_feature = await check_feature_cached(db, tenant_id, "custom_pdf")
     if not has_feature:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -271,3 +283,4 @@ async def delete_pdf_layout(
 
     await db.delete(layout)
     await db.commit()
+    invalidate_tenant_layouts(tenant_id)
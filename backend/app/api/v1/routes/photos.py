@@ -9,12 +9,18 @@ from typing import Optional
 from uuid import UUID
 import uuid
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
-from sqlalchemy import select
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Request, Response, UploadFile, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import column, func, select, update
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, lazyload, load_only
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 
+from app.core.config import settings
 from app.core.deps import get_current_user, get_db
+from app.core.http_cache import cache_headers, etag_matches, make_etag, not_modified
 from app.models.user import User
 from app.models.report import Report
 from app.models.report_checklist_response import ReportChecklistResponse
@@ -31,14 +37,44 @@ from app.schemas.photo import (
 
 router = APIRouter(prefix="/reports/{report_id}/photos", tags=["photos"])
 
+# Leading bytes read to identify an upload's image format
+IMAGE_SIGNATURE_BYTES = 16
+
+# ISO-BMFF brands (bytes 8-12 after "ftyp") of HEIC/HEIF photos
+HEIF_BRANDS = {b"heic", b"heix", b"hevc", b"hevx", b"heim", b"heis", b"mif1", b"msf1"}
+
+# The checklist response columns the photo endpoints read; answers,
+# comments and the rest of the row are not loaded
+PHOTO_RESPONSE_COLUMNS = (
+    ReportChecklistResponse.field_id,
+    ReportChecklistResponse.field_label,
+    ReportChecklistResponse.photos,
+)
+
 
 async def get_report_with_access(
     report_id: UUID,
     db: AsyncSession,
     user: User,
+    with_tenant: bool = False,
 ) -> Report:
-    """Get report and verify user has access."""
-    query = select(Report).where(Report.id == report_id).options(selectinload(Report.checklist_responses))
+    """
+    Get report and verify user has access.
+
+    None of the report's collections (checklist responses, info values,
+    signatures, certificates) are loaded here; callers query the response
+    rows they need directly. With with_tenant, report.tenant is loaded in
+    the same query (name and watermark settings only, none of the tenant's
+    own relationships).
+    """
+    query = select(Report).where(Report.id == report_id).options(lazyload("*"))
+    if with_tenant:
+        query = query.options(
+            joinedload(Report.tenant).options(
+                load_only(Tenant.name, Tenant.watermark_config),
+                lazyload("*"),
+            )
+        )
 
     # Superadmin (tenant_id=NULL) can access all reports
     # Regular users can only access reports from their tenant
@@ -76,8 +112,6 @@ async def upload_photo(
     The photo will be stored in cloud storage (R2) or local filesystem.
     Metadata including GPS coordinates and timestamp are stored with the photo.
     """
-    MAX_PHOTO_SIZE = 20 * 1024 * 1024  # 20 MB
-
     # Validate file type
     if not file.content_type or not file.content_type.startswith("image/"):
         raise HTTPException(
@@ -85,15 +119,17 @@ async def upload_photo(
             detail="File must be an image"
         )
 
-    # Validate file size - read content to check size
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset
+    # Validate file size - the multipart parser records it, so the spooled
+    # file (possibly on disk) is not touched on the event loop
+    file_size = file.size
+    if file_size is None:
+        file_size = len(await file.read())
+        await file.seek(0)
 
-    if file_size > MAX_PHOTO_SIZE:
+    if file_size > settings.max_photo_bytes:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"Photo exceeds maximum size of {MAX_PHOTO_SIZE // (1024*1024)} MB"
+            detail=f"Photo exceeds maximum size of {settings.max_photo_bytes // (1024*1024)} MB"
         )
 
     if file_size == 0:
@@ -102,8 +138,20 @@ async def upload_photo(
             detail="Uploaded file is empty"
         )
 
-    # Get report and verify access
-    report = await get_report_with_access(report_id, db, current_user)
+    # Check the file's magic bytes, not just the client-declared content
+    # type, before any database or storage work
+    content_type = _sniff_image_type(await file.read(IMAGE_SIGNATURE_BYTES))
+    await file.seek(0)
+    if content_type is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be an image"
+        )
+
+    # Get report (with its tenant, for the watermark) and verify access
+    report = await get_report_with_access(
+        report_id, db, current_user, with_tenant=True
+    )
 
     # Check report status - can only add photos to draft or in_progress
     if report.status not in ("draft", "in_progress"):
@@ -112,11 +160,22 @@ async def upload_photo(
             detail="Cannot add photos to completed or archived reports"
         )
 
-    # Find the checklist response
-    response = next(
-        (r for r in report.checklist_responses if str(r.id) == response_id),
-        None
-    )
+    # Fetch only the checklist response being updated, not the whole checklist
+    response = None
+    try:
+        response_uuid = UUID(response_id)
+    except ValueError:
+        response_uuid = None
+    if response_uuid is not None:
+        result = await db.execute(
+            select(ReportChecklistResponse)
+            .options(load_only(*PHOTO_RESPONSE_COLUMNS))
+            .where(
+                ReportChecklistResponse.id == response_uuid,
+                ReportChecklistResponse.report_id == report.id,
+            )
+        )
+        response = result.scalar_one_or_none()
     if not response:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -125,41 +184,28 @@ async def upload_photo(
 
     # Check photo count limit from template snapshot
     current_photos = response.photos or []
-    max_photos = _get_max_photos_for_field(report, response)
+    photo_config = _photo_config_for(report.photo_config_map, response)
+    max_photos = _get_max_photos_for_field(photo_config)
     if max_photos and len(current_photos) >= max_photos:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Maximum {max_photos} photos allowed for this field"
         )
 
-    # Read original file bytes before uploading (needed for watermarking)
-    file.file.seek(0)
-    original_bytes = file.file.read()
-    file.file.seek(0)
+    # Give the connection back to the pool while the photo is watermarked and
+    # uploaded (seconds); the final write below checks out a fresh one.
+    # expire_on_commit=False keeps report and response usable meanwhile.
+    await db.commit()
 
-    # Upload to storage - use report's tenant_id for proper isolation
-    storage = get_storage_service()
-    try:
-        url, storage_path = storage.upload_photo(
-            file=file.file,
-            tenant_id=str(report.tenant_id),
-            report_id=str(report_id),
-            response_id=response_id,
-            original_filename=file.filename or "photo.jpg",
-            content_type=file.content_type or "image/jpeg",
-        )
-    except StorageError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    # Read the photo once; the same bytes feed the watermark and the upload
+    original_bytes = await file.read()
 
-    # Apply server-side watermark
-    tenant_result = await db.execute(
-        select(Tenant).where(Tenant.id == report.tenant_id)
-    )
-    tenant = tenant_result.scalar_one_or_none()
+    # Apply server-side watermark before storing, so the photo is uploaded
+    # once instead of uploaded and then overwritten
+    tenant = report.tenant
+    now = datetime.utcnow()
 
+    photo_bytes = original_bytes
     watermarked = False
     if tenant:
         watermark_config = tenant.watermark_config  # JSONB or None
@@ -169,7 +215,8 @@ async def upload_photo(
             "company_name": tenant.name,
             "technician_name": current_user.full_name,
             "report_number": report.title,
-            "datetime": datetime.utcnow().strftime("%d/%m/%Y %H:%M"),
+            # dd/mm/YYYY HH:MM, formatted without strftime
+            "datetime": f"{now.day:02d}/{now.month:02d}/{now.year} {now.hour:02d}:{now.minute:02d}",
         }
 
         if latitude is not None and longitude is not None:
@@ -178,20 +225,36 @@ async def upload_photo(
             wm_context["address"] = address
 
         try:
-            watermarked_bytes = watermark_service.apply_watermark(
-                original_bytes, watermark_config, wm_context
+            # Pillow work is CPU-bound; keep it off the event loop
+            photo_bytes = await run_in_threadpool(
+                watermark_service.apply_watermark,
+                original_bytes, watermark_config, wm_context,
             )
-            # Re-upload watermarked version, overwriting the original path
-            if storage.is_cloud_storage:
-                storage._upload_to_r2(BytesIO(watermarked_bytes), storage_path, "image/jpeg")
-            else:
-                storage._upload_to_local(BytesIO(watermarked_bytes), storage_path)
+            content_type = "image/jpeg"
             watermarked = True
         except Exception as e:
-            # If watermark fails, keep the original upload (don't break upload flow)
+            # If watermark fails, store the original (don't break upload flow)
             import logging
             logging.getLogger(__name__).warning(f"Watermark failed: {e}")
 
+    # Upload to storage - use report's tenant_id for proper isolation
+    storage = get_storage_service()
+    try:
+        url, _storage_path = await run_in_threadpool(
+            storage.upload_photo,
+            file=BytesIO(photo_bytes),
+            tenant_id=str(report.tenant_id),
+            report_id=str(report_id),
+            response_id=response_id,
+            original_filename=file.filename or "photo.jpg",
+            content_type=content_type,
+        )
+    except StorageError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
     # Build GPS coordinates if provided
     gps = None
     if latitude is not None and longitude is not None:
@@ -202,16 +265,13 @@ async def upload_photo(
         )
 
     # Parse captured_at
-    capture_time = datetime.utcnow()
+    capture_time = now
     if captured_at:
-        try:
-            capture_time = datetime.fromisoformat(captured_at.replace("Z", "+00:00"))
-        except ValueError:
-            pass
+        capture_time = _parse_captured_at(captured_at) or now
 
     # Create photo metadata
     photo = PhotoMetadata(
-        id=str(uuid.uuid4()),
+        id=uuid.uuid4().hex,
         url=url,
         original_filename=file.filename,
         size_bytes=file.size,
@@ -221,8 +281,29 @@ async def upload_photo(
         watermarked=watermarked,
     )
 
+    # Re-read status and photos under row locks: the report may have been
+    # completed, or other uploads may have filled the field, while this one
+    # was being stored. FOR SHARE on the report lets concurrent uploads in
+    await db.refresh(report, ["status"], with_for_update={"read": True})
+    await db.refresh(response, ["photos"], with_for_update=True)
+
+    rejection = None
+    if report.status not in ("draft", "in_progress"):
+        rejection = "Cannot add photos to completed or archived reports"
+    elif max_photos and len(response.photos or []) >= max_photos:
+        rejection = f"Maximum {max_photos} photos allowed for this field"
+    if rejection is not None:
+        # Same 400 as the early checks; the stored object is removed after
+        # the response is sent (HTTPException would drop background tasks)
+        await db.rollback()
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"detail": rejection},
+            background=BackgroundTask(storage.delete_object, _storage_path),
+        )
+
     # Update response photos array
-    photos_list = list(current_photos)
+    photos_list = list(response.photos or [])
     photos_list.append(photo.model_dump(mode="json"))
     response.photos = photos_list
 
@@ -235,6 +316,7 @@ async def upload_photo(
 async def delete_photo(
     report_id: UUID,
     photo_id: str,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -253,50 +335,38 @@ async def delete_photo(
             detail="Cannot delete photos from completed or archived reports"
         )
 
-    # Find the photo across all responses
-    photo_found = False
-    storage_path = None
-
-    for response in report.checklist_responses:
-        if not response.photos:
-            continue
-
-        photos = list(response.photos)
-        for i, p in enumerate(photos):
-            if p.get("id") == photo_id:
-                photo_found = True
-                # Extract storage path from URL for deletion
-                url = p.get("url", "")
-                if url.startswith("/uploads/"):
-                    storage_path = url[9:]  # Remove /uploads/ prefix
-
-                # Remove from array
-                photos.pop(i)
-                response.photos = photos
-                break
+    # Remove the photo server-side in one statement: Postgres finds the
+    # response holding it, rewrites its photos array and returns the URL
+    result = await db.execute(_remove_photo_statement(report.id, photo_id))
+    removed = result.first()
 
-        if photo_found:
-            break
-
-    if not photo_found:
+    if removed is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Photo not found"
         )
 
-    # Delete from storage
-    if storage_path:
-        storage = get_storage_service()
-        storage.delete_object(storage_path)
+    # Extract storage path from URL for deletion
+    storage_path = None
+    url = removed.url or ""
+    if url.startswith("/uploads/"):
+        storage_path = url[9:]  # Remove /uploads/ prefix
 
     await db.commit()
 
+    # Delete from storage once the removal is committed, after the response
+    # is sent (boto3 is blocking; background tasks run in the threadpool)
+    if storage_path:
+        background_tasks.add_task(get_storage_service().delete_object, storage_path)
+
     return PhotoDeleteResponse()
 
 
 @router.get("", response_model=list[PhotoListResponse])
 async def list_photos(
     report_id: UUID,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -304,55 +374,157 @@ async def list_photos(
     List all photos for a report, grouped by checklist response.
 
     Returns photos organized by the checklist field they belong to.
+    Responses carry an ETag; a matching If-None-Match gets a 304 without
+    loading the checklist responses.
     """
     # Get report and verify access
     report = await get_report_with_access(report_id, db, current_user)
 
+    # Photos live on the responses and the snapshot never changes, so the
+    # newest response update (plus the count) fingerprints the listing
+    latest_update, response_count = (
+        await db.execute(
+            select(
+                func.max(ReportChecklistResponse.updated_at), func.count()
+            ).where(ReportChecklistResponse.report_id == report.id)
+        )
+    ).one()
+    etag = make_etag(report.id, latest_update, response_count)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    response.headers.update(cache_headers(etag))
+
+    result = await db.execute(
+        select(ReportChecklistResponse)
+        .options(load_only(*PHOTO_RESPONSE_COLUMNS))
+        .where(ReportChecklistResponse.report_id == report.id)
+    )
+
+    # Plain dicts: the response_model validates the whole listing (stored
+    # photo dicts included) in one pass, instead of building a PhotoMetadata
+    # per photo here in Python
     results = []
-    for response in report.checklist_responses:
-        photos = response.photos or []
-        max_photos = _get_max_photos_for_field(report, response)
-        required = _is_photo_required_for_field(report, response)
+    for checklist_response in result.scalars().all():
+        photos = checklist_response.photos or []
+        photo_config = _photo_config_for(report.photo_config_map, checklist_response)
+        max_photos = _get_max_photos_for_field(photo_config)
+        required = _is_photo_required_for_field(photo_config)
 
         if photos or required:  # Include fields with photos or required photos
-            results.append(
-                PhotoListResponse(
-                    response_id=str(response.id),
-                    field_label=response.field_label,
-                    photos=[PhotoMetadata(**p) for p in photos],
-                    max_photos=max_photos,
-                    required=required,
-                )
-            )
+            results.append({
+                "response_id": str(checklist_response.id),
+                "field_label": checklist_response.field_label,
+                "photos": photos,
+                "max_photos": max_photos,
+                "required": required,
+            })
 
     return results
 
 
-def _get_max_photos_for_field(report: Report, response: ReportChecklistResponse) -> Optional[int]:
-    """Get max photo count from template snapshot for this field."""
-    snapshot = report.template_snapshot
-    if not snapshot:
-        return None
+def _remove_photo_statement(report_id: UUID, photo_id: str):
+    """
+    Build an UPDATE removing a photo from the response that holds it.
+
+    The target CTE locks the row (photos @> [{"id": photo_id}]) and keeps
+    its photos array as it was before the update, so RETURNING can read the
+    removed photo's URL; the SET rebuilds the array without it, in order.
+    """
+    target = (
+        select(ReportChecklistResponse.id, ReportChecklistResponse.photos)
+        .where(
+            ReportChecklistResponse.report_id == report_id,
+            ReportChecklistResponse.photos.contains([{"id": photo_id}]),
+        )
+        .with_for_update()
+        .cte("target")
+    )
+
+    def elements():
+        return func.jsonb_array_elements(target.c.photos).table_valued(
+            column("value", JSONB), with_ordinality="idx"
+        ).render_derived("photo")
+
+    kept = elements()
+    remaining_photos = (
+        select(
+            func.coalesce(
+                func.jsonb_agg(aggregate_order_by(kept.c.value, kept.c.idx)),
+                func.jsonb_build_array(),
+            )
+        )
+        .where(kept.c.value["id"].astext.is_distinct_from(photo_id))
+        .scalar_subquery()
+    )
+
+    removed = elements()
+    removed_url = (
+        select(removed.c.value["url"].astext)
+        .where(removed.c.value["id"].astext == photo_id)
+        .limit(1)
+        .scalar_subquery()
+    )
+
+    return (
+        update(ReportChecklistResponse)
+        .where(ReportChecklistResponse.id == target.c.id)
+        .values(photos=remaining_photos)
+        .returning(removed_url.label("url"))
+        .execution_options(synchronize_session=False)
+    )
 
-    for section in snapshot.get("sections", []):
-        for field in section.get("fields", []):
-            if field.get("id") == str(response.field_id) or field.get("label") == response.field_label:
-                photo_config = field.get("photo_config", {})
-                return photo_config.get("max_count")
 
+def _sniff_image_type(head: bytes) -> Optional[str]:
+    """Identify a photo format from its leading bytes; None if not an image."""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head[4:8] == b"ftyp" and head[8:12] in HEIF_BRANDS:
+        return "image/heic"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
     return None
 
 
-def _is_photo_required_for_field(report: Report, response: ReportChecklistResponse) -> bool:
-    """Check if photo is required from template snapshot for this field."""
-    snapshot = report.template_snapshot
-    if not snapshot:
-        return False
+def _parse_captured_at(value: str) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 capture timestamp, or None if it is malformed.
+
+    fromisoformat accepts a trailing "Z" on Python 3.11+, so the common
+    case is a single C-level parse; the replace only runs as a fallback.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
 
-    for section in snapshot.get("sections", []):
-        for field in section.get("fields", []):
-            if field.get("id") == str(response.field_id) or field.get("label") == response.field_label:
-                photo_config = field.get("photo_config", {})
-                return photo_config.get("required", False) or (photo_config.get("min_count", 0) > 0)
 
-    return False
+def _photo_config_for(
+    config_map: dict[str, dict], response: ReportChecklistResponse
+) -> Optional[dict]:
+    """Get the photo_config of the snapshot field behind a checklist response."""
+    photo_config = config_map.get(str(response.field_id))
+    if photo_config is None:
+        photo_config = config_map.get(response.field_label)
+    return photo_config
+
+
+def _get_max_photos_for_field(photo_config: Optional[dict]) -> Optional[int]:
+    """Get max photo count from a field's photo_config."""
+    if photo_config is None:
+        return None
+    return photo_config.get("max_count")
+
+
+def _is_photo_required_for_field(photo_config: Optional[dict]) -> bool:
+    """Check if photo is required from a field's photo_config."""
+    if photo_config is None:
+        return False
+    return photo_config.get("required", False) or (photo_config.get("min_count", 0) > 0)
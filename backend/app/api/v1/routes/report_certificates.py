@@ -10,7 +10,8 @@ Manages the link between reports and calibration certificates:
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select, func, and_
+from sqlalchemy import Row, bindparam, delete, select, func, and_, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -27,21 +28,40 @@ from app.schemas.certificate import (
 
 router = APIRouter(prefix="/reports/{report_id}/certificates", tags=["report-certificates"])
 
+# One link per (report, certificate) pair (migration 009)
+REPORT_CERTIFICATE_CONSTRAINT = "uq_report_certificate"
+
+# Built once at import and executed with a bound report id
+LINKED_CERTIFICATES_STMT = (
+    select(CalibrationCertificate)
+    .join(
+        ReportCertificate,
+        ReportCertificate.certificate_id == CalibrationCertificate.id,
+    )
+    .where(ReportCertificate.report_id == bindparam("report_id"))
+    .order_by(CalibrationCertificate.equipment_name.asc())
+)
+
 
 async def _get_report_with_tenant_check(
     report_id: UUID,
     db: AsyncSession,
     tenant_id: UUID | None,
-) -> Report:
-    """Get report with tenant filtering."""
+) -> Row:
+    """
+    Get report id and tenant_id with tenant filtering.
+
+    Only the two columns the certificate endpoints use are read, not the
+    full Report entity with its eagerly loaded collections.
+    """
     conditions = [Report.id == report_id]
     if tenant_id is not None:
         conditions.append(Report.tenant_id == tenant_id)
 
     result = await db.execute(
-        select(Report).where(and_(*conditions))
+        select(Report.id, Report.tenant_id).where(and_(*conditions))
     )
-    report = result.scalar_one_or_none()
+    report = result.first()
 
     if not report:
         raise HTTPException(
@@ -52,6 +72,20 @@ async def _get_report_with_tenant_check(
     return report
 
 
+async def _linked_certificates(
+    db: AsyncSession,
+    report_id: UUID,
+) -> CertificateListResponse:
+    """List the certificates linked to a report, by equipment name."""
+    result = await db.execute(LINKED_CERTIFICATES_STMT, {"report_id": report_id})
+    certificates = result.scalars().all()
+
+    return CertificateListResponse(
+        certificates=[CertificateResponse.model_validate(c) for c in certificates],
+        total=len(certificates),
+    )
+
+
 @router.get("/", response_model=CertificateListResponse)
 async def list_report_certificates(
     report_id: UUID,
@@ -62,23 +96,7 @@ async def list_report_certificates(
     """List all calibration certificates linked to a report."""
     report = await _get_report_with_tenant_check(report_id, db, tenant_id)
 
-    # Query certificates linked to this report
-    query = (
-        select(CalibrationCertificate)
-        .join(
-            ReportCertificate,
-            ReportCertificate.certificate_id == CalibrationCertificate.id,
-        )
-        .where(ReportCertificate.report_id == report.id)
-        .order_by(CalibrationCertificate.equipment_name.asc())
-    )
-    result = await db.execute(query)
-    certificates = result.scalars().all()
-
-    return CertificateListResponse(
-        certificates=[CertificateResponse.model_validate(c) for c in certificates],
-        total=len(certificates),
-    )
+    return await _linked_certificates(db, report.id)
 
 
 @router.post("/link", response_model=CertificateListResponse)
@@ -103,64 +121,59 @@ async def link_certificates(
             detail="Lista de certificate_ids nao pode ser vazia",
         )
 
-    # Verify all certificates exist and belong to the same tenant
+    # One query serves both the validation and the response: the requested
+    # certificates plus those already linked, in listing order
+    requested_ids = set(data.certificate_ids)
     cert_result = await db.execute(
-        select(CalibrationCertificate).where(
-            and_(
-                CalibrationCertificate.id.in_(data.certificate_ids),
-                CalibrationCertificate.tenant_id == report.tenant_id,
-                CalibrationCertificate.is_active == True,
+        select(CalibrationCertificate)
+        .where(
+            or_(
+                CalibrationCertificate.id.in_(requested_ids),
+                CalibrationCertificate.id.in_(
+                    select(ReportCertificate.certificate_id).where(
+                        ReportCertificate.report_id == report.id
+                    )
+                ),
             )
         )
+        .order_by(CalibrationCertificate.equipment_name.asc())
     )
-    valid_certs = cert_result.scalars().all()
-    valid_cert_ids = {c.id for c in valid_certs}
-
-    invalid_ids = set(data.certificate_ids) - valid_cert_ids
+    certs = cert_result.scalars().all()
+
+    # Verify all certificates exist, are active and belong to the same tenant
+    valid_cert_ids = {
+        c.id
+        for c in certs
+        if c.id in requested_ids
+        and c.tenant_id == report.tenant_id
+        and c.is_active
+    }
+
+    invalid_ids = requested_ids - valid_cert_ids
     if invalid_ids:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Certificados nao encontrados ou inativos: {[str(i) for i in invalid_ids]}",
         )
 
-    # Get existing links to avoid duplicates
-    existing_result = await db.execute(
-        select(ReportCertificate.certificate_id).where(
-            and_(
-                ReportCertificate.report_id == report.id,
-                ReportCertificate.certificate_id.in_(data.certificate_ids),
-            )
-        )
+    # Create the new links in one INSERT; links that already exist are
+    # skipped by the unique constraint instead of a lookup beforehand
+    await db.execute(
+        pg_insert(ReportCertificate)
+        .values([
+            {"report_id": report.id, "certificate_id": cert_id}
+            for cert_id in valid_cert_ids
+        ])
+        .on_conflict_do_nothing(constraint=REPORT_CERTIFICATE_CONSTRAINT)
     )
-    existing_cert_ids = {row[0] for row in existing_result.all()}
-
-    # Create new links
-    for cert_id in data.certificate_ids:
-        if cert_id not in existing_cert_ids:
-            link = ReportCertificate(
-                report_id=report.id,
-                certificate_id=cert_id,
-            )
-            db.add(link)
 
     await db.commit()
 
-    # Return updated list
-    query = (
-        select(CalibrationCertificate)
-        .join(
-            ReportCertificate,
-            ReportCertificate.certificate_id == CalibrationCertificate.id,
-        )
-        .where(ReportCertificate.report_id == report.id)
-        .order_by(CalibrationCertificate.equipment_name.asc())
-    )
-    result = await db.execute(query)
-    certificates = result.scalars().all()
-
+    # Every requested certificate is now linked, so the certificates read
+    # above are exactly the updated list
     return CertificateListResponse(
-        certificates=[CertificateResponse.model_validate(c) for c in certificates],
-        total=len(certificates),
+        certificates=[CertificateResponse.model_validate(c) for c in certs],
+        total=len(certs),
     )
 
 
@@ -185,36 +198,17 @@ async def unlink_certificates(
             detail="Lista de certificate_ids nao pode ser vazia",
         )
 
-    # Find existing links to delete
-    existing_result = await db.execute(
-        select(ReportCertificate).where(
+    # Delete the links in one statement; ids not linked match no rows
+    await db.execute(
+        delete(ReportCertificate).where(
             and_(
                 ReportCertificate.report_id == report.id,
                 ReportCertificate.certificate_id.in_(data.certificate_ids),
             )
         )
     )
-    links_to_delete = existing_result.scalars().all()
-
-    for link in links_to_delete:
-        await db.delete(link)
 
     await db.commit()
 
     # Return updated list
-    query = (
-        select(CalibrationCertificate)
-        .join(
-            ReportCertificate,
-            ReportCertificate.certificate_id == CalibrationCertificate.id,
-        )
-        .where(ReportCertificate.report_id == report.id)
-        .order_by(CalibrationCertificate.equipment_name.asc())
-    )
-    result = await db.execute(query)
-    certificates = result.scalars().all()
-
-    return CertificateListResponse(
-        certificates=[CertificateResponse.model_validate(c) for c in certificates],
-        total=len(certificates),
-    )
+    return await _linked_certificates(db, report.id)
@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.deps import get_current_user, get_db
+from app.models.base import uuid7
 from app.models.user import User
 from app.models.report import Report
 from app.models.report_signature import ReportSignature
@@ -121,7 +122,7 @@ async def upload_signature(
     # Create signature record - use report's tenant_id for proper isolation
     signed_at = datetime.utcnow()
     signature = ReportSignature(
-        id=uuid.uuid4(),
+        id=uuid7(),
         tenant_id=report.tenant_id,
         report_id=report_id,
         role_name=role_name,
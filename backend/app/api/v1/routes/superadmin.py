@@ -37,6 +37,7 @@ from app.models.user import User
 from app.schemas.tenant_config import (
     AssignPlanRequest,
     SuspendTenantRequest,
+    TenantAuditLogListResponse,
     TenantAuditLogResponse,
     TenantConfigResponse,
     TenantConfigUpdate,
@@ -45,8 +46,10 @@ from app.schemas.tenant_config import (
     TenantPlanResponse,
     TenantPlanUpdate,
     TenantUsageResponse,
+    TenantWithConfigListResponse,
     TenantWithConfigResponse,
 )
+from app.services.feature_check import invalidate_feature_cache
 from app.services.tenant_provisioning import tenant_provisioning_service
 from app.services.tenant_status import tenant_status_service
 
@@ -126,7 +129,7 @@ async def create_tenant(
     )
 
 
-@router.get("/tenants")
+@router.get("/tenants", response_model=TenantWithConfigListResponse)
 async def list_tenants(
     current_user: Annotated[User, Depends(require_superadmin)],
     db: AsyncSession = Depends(get_db),
@@ -179,7 +182,7 @@ async def list_tenants(
             )
         )
 
-    return {"items": [item.model_dump() for item in items], "total": total, "page": page}
+    return TenantWithConfigListResponse(items=items, total=total, page=page)
 
 
 @router.get("/tenants/{tenant_id}", response_model=TenantWithConfigResponse)
@@ -263,8 +266,12 @@ async def update_tenant_config(
         if config:
             config.contract_type = data.contract_type
 
+    # Commit before dropping cached flags, so no request re-caches the old ones
+    await db.commit()
+    if data.features_json is not None:
+        invalidate_feature_cache(tenant_id)
+
     # Refresh and return
-    await db.flush()
     result = await db.execute(select(Tenant).where(Tenant.id == tenant_id))
     tenant = result.scalar_one_or_none()
     usage = await tenant_status_service.get_tenant_usage(db, tenant.id)
@@ -354,10 +361,14 @@ async def assign_plan(
             detail=str(e),
         )
 
+    # The plan's features replace the tenant's; drop cached flags once committed
+    await db.commit()
+    invalidate_feature_cache(tenant_id)
+
     return _config_to_response(config)
 
 
-@router.get("/tenants/{tenant_id}/audit")
+@router.get("/tenants/{tenant_id}/audit", response_model=TenantAuditLogListResponse)
 async def get_tenant_audit_log(
     tenant_id: UUID,
     current_user: Annotated[User, Depends(require_superadmin)],
@@ -393,7 +404,7 @@ async def get_tenant_audit_log(
         for log in logs
     ]
 
-    return {"items": [item.model_dump() for item in items], "total": total, "page": page}
+    return TenantAuditLogListResponse(items=items, total=total, page=page)
 
 
 @router.get("/tenants/{tenant_id}/usage", response_model=TenantUsageResponse)
@@ -510,7 +521,10 @@ async def update_plan(
     if data.is_active is not None:
         plan.is_active = data.is_active
 
-    await db.flush()
+    await db.commit()
+    if data.features is not None:
+        # Plan defaults apply to every tenant on the plan
+        invalidate_feature_cache()
 
     return _plan_to_response(plan)
 
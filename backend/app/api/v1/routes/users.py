@@ -21,8 +21,8 @@ from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.deps import require_tenant_admin, get_current_user
-from app.core.security import hash_password
+from app.core.deps import require_tenant_admin, get_current_user, invalidate_cached_user
+from app.core.security import hash_password_async
 from app.models.user import User
 from app.schemas.user import (
     UserCreate,
@@ -104,7 +104,7 @@ async def create_user(
     user = User(
         email=user_data.email,
         full_name=user_data.full_name,
-        password_hash=hash_password(user_data.password),
+        password_hash=await hash_password_async(user_data.password),
         role=user_data.role.value,
         tenant_id=tenant_id,
     )
@@ -225,9 +225,10 @@ async def update_user(
     if user_data.is_active is not None:
         user.is_active = user_data.is_active
     if user_data.password is not None:
-        user.password_hash = hash_password(user_data.password)
+        user.password_hash = await hash_password_async(user_data.password)
 
     await db.commit()
+    invalidate_cached_user(user.id)
     await db.refresh(user)
 
     return UserResponse.model_validate(user)
@@ -280,5 +281,6 @@ async def delete_user(
 
     await db.delete(user)
     await db.commit()
+    invalidate_cached_user(user_id)
 
     return None
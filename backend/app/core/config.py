@@ -11,6 +11,11 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = Field(..., description="PostgreSQL connection URL")
+    # Connection pool (per worker process)
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle_seconds: int = 1800
+    db_null_pool: bool = False  # True behind PgBouncer: no app-side pooling
 
     @field_validator("database_url", mode="before")
     @classmethod
@@ -46,9 +51,16 @@ class Settings(BaseSettings):
     r2_bucket_name: str = "smarthand-photos"
     r2_public_url: str = ""  # Public URL for R2 bucket (e.g., https://pub-xxx.r2.dev)
 
+    # Photo uploads
+    max_photo_bytes: int = 20 * 1024 * 1024  # 20 MB
+
     # Redis
     redis_url: str = "redis://localhost:6379/0"
 
+    # Rate limiting - shared store so limits hold across workers/instances
+    # (e.g. redis://localhost:6379/1); memory:// keeps counters per process
+    rate_limit_storage_uri: str = "memory://"
+
     # JWT Authentication
     jwt_secret_key: str = Field(..., description="Secret key for JWT signing (required)")
     jwt_algorithm: str = "HS256"
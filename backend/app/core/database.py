@@ -1,14 +1,45 @@
 from collections.abc import AsyncGenerator
+from typing import Any
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB parameters (photos arrays, template snapshots) with orjson."""
+    return orjson.dumps(value).decode()
+
+
+# Connection pool. The pool is sized for concurrent requests (each request
+# holds at most one connection at a time, on its get_db session), pre-pings
+# to drop connections the server closed, and recycles them before idle
+# timeouts. Behind an external pooler (PgBouncer) set DB_NULL_POOL so
+# connections are not pooled twice.
+if settings.db_null_pool:
+    pool_options: dict[str, Any] = {"poolclass": NullPool}
+else:
+    pool_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+    }
+
 # Create async engine
+# Sessions hold a pooled connection from their first query until commit or
+# rollback, so never await long external I/O (storage uploads, image
+# processing) inside an open transaction: commit first, the session picks
+# up a fresh connection for its next query.
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
-    future=True
+    future=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    **pool_options,
 )
 
 # Create async session factory
@@ -8,19 +8,25 @@ This module provides:
 - require_superadmin: Dependency for superadmin-only routes
 - require_tenant_admin: Dependency for tenant admin and above
 - get_tenant_filter: Dependency for tenant-scoped queries
+- require_auth_context: Dependency factory for user, role check and tenant filter together
 - check_tenant_active: Dependency to block suspended tenants
+- invalidate_cached_user: Drop a user from the get_current_user cache
 """
 
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status, Query
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.core.database import get_db
-from app.core.security import decode_token
+from app.core.security import decode_token_cached
 from app.models.tenant_config import TenantConfig
 from app.models.user import User
 from app.schemas.user import UserRole, ROLE_HIERARCHY
@@ -29,6 +35,69 @@ from app.schemas.user import UserRole, ROLE_HIERARCHY
 # OAuth2 scheme for extracting bearer tokens
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# Statements run on every authenticated request, built once at import and
+# executed with bound parameters
+USER_BY_ID_STMT = select(User).where(User.id == bindparam("user_id"))
+TENANT_CONFIG_BY_TENANT_STMT = select(TenantConfig).where(
+    TenantConfig.tenant_id == bindparam("tenant_id")
+)
+
+# Column values of recently authenticated users, keyed by user id, so most
+# requests skip the users lookup. Entries are dropped by the user routes on
+# update/delete; the TTL bounds how long other workers may serve a stale
+# row (e.g. a deactivated user) after such a change. Only the columns
+# auth and UserResponse read are kept; password_hash never enters the cache.
+USER_CACHE_TTL_SECONDS = 60
+USER_CACHE_MAX_SIZE = 5000
+_user_cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+_USER_COLUMNS = (
+    "id",
+    "tenant_id",
+    "email",
+    "full_name",
+    "role",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+
+
+def invalidate_cached_user(user_id) -> None:
+    """Drop a user from the get_current_user cache after it changes."""
+    _user_cache.pop(str(user_id), None)
+
+
+async def _load_user(db: AsyncSession, user_id: str) -> User | None:
+    """
+    Load a user by id, from the cache when possible.
+
+    Cached users are attached to the session with merge(load=False), which
+    emits no SQL; the session gets its own instance, never the cached values.
+    Columns left out of the cache (password_hash) stay unloaded on it.
+    """
+    entry = _user_cache.get(user_id)
+    if entry is not None:
+        expires_at, values = entry
+        if expires_at > time.monotonic():
+            _user_cache.move_to_end(user_id)
+            user = User(**values)
+            make_transient_to_detached(user)
+            return await db.merge(user, load=False)
+        del _user_cache[user_id]
+
+    result = await db.execute(USER_BY_ID_STMT, {"user_id": user_id})
+    user = result.scalar_one_or_none()
+    if user is None:
+        return None
+
+    _user_cache[user_id] = (
+        time.monotonic() + USER_CACHE_TTL_SECONDS,
+        {key: getattr(user, key) for key in _USER_COLUMNS},
+    )
+    if len(_user_cache) > USER_CACHE_MAX_SIZE:
+        _user_cache.popitem(last=False)
+    return user
+
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
@@ -53,7 +122,7 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    payload = decode_token(token)
+    payload = decode_token_cached(token)
     if payload is None:
         raise credentials_exception
 
@@ -64,9 +133,7 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-
+    user = await _load_user(db, user_id)
     if user is None:
         raise credentials_exception
 
@@ -282,6 +349,47 @@ async def get_tenant_filter(
     return current_user.tenant_id
 
 
+@dataclass(slots=True, frozen=True)
+class AuthContext:
+    """Authenticated user and the tenant filter that applies to them."""
+
+    user: User
+    tenant_id: UUID | None
+
+
+def require_auth_context(*allowed_roles: str):
+    """
+    Dependency factory resolving the user, role check and tenant filter at once.
+
+    Routes that need both the user and get_tenant_filter take a single
+    AuthContext instead of separate require_role / get_tenant_filter params.
+
+    Usage:
+        @router.post("/certificates")
+        async def create_certificate(
+            auth: Annotated[AuthContext, Depends(require_auth_context("tenant_admin", "superadmin"))]
+        ):
+            ...
+
+    Args:
+        *allowed_roles: Roles that are allowed to access the route (any role if empty)
+
+    Returns:
+        Dependency function returning an AuthContext
+    """
+    async def context_resolver(
+        current_user: Annotated[User, Depends(get_current_user)],
+        tenant_id: Annotated[UUID | None, Depends(get_tenant_filter)],
+    ) -> AuthContext:
+        if allowed_roles and current_user.role not in allowed_roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Acesso negado - permissao insuficiente"
+            )
+        return AuthContext(user=current_user, tenant_id=tenant_id)
+    return context_resolver
+
+
 async def require_same_tenant_or_superadmin(
     current_user: Annotated[User, Depends(get_current_user)],
     target_tenant_id: UUID,
@@ -336,7 +444,7 @@ async def check_tenant_active(
         return current_user
 
     result = await db.execute(
-        select(TenantConfig).where(TenantConfig.tenant_id == current_user.tenant_id)
+        TENANT_CONFIG_BY_TENANT_STMT, {"tenant_id": current_user.tenant_id}
     )
     config = result.scalar_one_or_none()
 
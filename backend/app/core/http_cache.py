@@ -0,0 +1,45 @@
+"""
+Conditional GET helpers (ETag / If-None-Match).
+
+Endpoints build an ETag from a cheap fingerprint of the data they would
+return and answer a matching If-None-Match with an empty 304 instead of
+running and serializing the full response.
+
+Usage:
+    etag = make_etag(tenant_id, latest_update, row_count)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    response.headers.update(cache_headers(etag))
+"""
+
+import hashlib
+
+from fastapi import Response, status
+
+# Responses are per-user (tenant data): shared caches must not store them,
+# and browsers must revalidate every time
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """Build a strong ETag (quoted hash) from the given fingerprint parts."""
+    key = ":".join(map(str, parts))
+    return '"' + hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header (possibly a list or weak tags) against etag."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    """Headers sent with both full and 304 responses."""
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response for a matching If-None-Match."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag))
@@ -0,0 +1,22 @@
+"""
+Shared rate limiter.
+
+A single Limiter instance is used by the app (app.state.limiter) and by
+route decorators, so every worker counts against the same store. With a
+Redis storage URI the moving-window counters are global across workers and
+instances; if Redis is unreachable, limits fall back to in-memory counting
+instead of failing the request.
+"""
+
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from app.core.config import settings
+
+
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.rate_limit_storage_uri,
+    strategy="moving-window",
+    in_memory_fallback_enabled=True,
+)
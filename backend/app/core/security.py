@@ -6,6 +6,11 @@ This module provides:
 - Password hashing with Argon2 (NIST recommended)
 """
 
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 import jwt
@@ -17,6 +22,23 @@ from app.core.config import settings
 # Password hasher using Argon2 (recommended by NIST)
 password_hash = PasswordHash.recommended()
 
+# Dedicated pool for Argon2 work. argon2-cffi releases the GIL while hashing,
+# so threads already run in parallel; sizing the pool to the CPU count keeps
+# concurrent logins from oversubscribing the cores (and from allocating
+# Argon2's memory cost once per threadpool thread) or starving the shared
+# threadpool used for other blocking calls.
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="argon2",
+)
+
+# Verified access token payloads, keyed by the raw token. A client sends the
+# same access token on every request until it expires, so repeat requests
+# skip signature verification and JSON decoding. Entries are only served
+# while their "exp" is in the future; the oldest are evicted past the limit.
+TOKEN_CACHE_MAX_SIZE = 4096
+_token_cache: "OrderedDict[str, dict]" = OrderedDict()
+
 
 def create_access_token(data: dict) -> str:
     """
@@ -66,8 +88,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify password against hash.
 
-    Note: This is CPU-intensive. Run in threadpool for async routes:
-        await run_in_threadpool(verify_password, password, hash)
+    Note: This is CPU-intensive. Use verify_password_async() in async routes.
 
     Args:
         plain_password: Plain text password to verify
@@ -96,6 +117,20 @@ def hash_password(password: str) -> str:
     return password_hash.hash(password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify password against hash on the Argon2 pool, without blocking the loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, verify_password, plain_password, hashed_password
+    )
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash password on the Argon2 pool, without blocking the loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, hash_password, password)
+
+
 def decode_token(token: str) -> dict | None:
     """
     Decode and verify JWT token.
@@ -115,3 +150,34 @@ def decode_token(token: str) -> dict | None:
         return payload
     except jwt.InvalidTokenError:
         return None
+
+
+def decode_token_cached(token: str) -> dict | None:
+    """
+    Decode and verify JWT token, reusing the result for repeated tokens.
+
+    Same result as decode_token(); intended for access tokens, which are
+    presented on every request. The returned payload is shared between
+    calls and must not be mutated.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Decoded payload dict, or None if invalid/expired
+    """
+    payload = _token_cache.get(token)
+    if payload is not None:
+        if payload.get("exp", 0) > time.time():
+            _token_cache.move_to_end(token)
+            return payload
+        del _token_cache[token]
+
+    payload = decode_token(token)
+    if payload is None or "exp" not in payload:
+        return payload
+
+    _token_cache[token] = payload
+    if len(_token_cache) > TOKEN_CACHE_MAX_SIZE:
+        _token_cache.popitem(last=False)
+    return payload
@@ -5,11 +5,12 @@ from typing import AsyncGenerator
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
 
 from app.core.config import settings
+from app.core.rate_limit import limiter
+from app.services.storage import IMMUTABLE_CACHE_CONTROL
 
 
 @asynccontextmanager
@@ -28,8 +29,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # (placeholder for future implementation)
 
 
-# Rate limiting configuration
-limiter = Limiter(key_func=get_remote_address)
+class ImmutableStaticFiles(StaticFiles):
+    """Static files served with the same long-lived caching as R2 objects."""
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", IMMUTABLE_CACHE_CONTROL)
+        return response
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -95,4 +102,4 @@ app.include_router(dashboard_router, prefix="/api/v1")
 # Mount static files for local photo storage (development)
 uploads_path = Path("uploads")
 uploads_path.mkdir(exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=str(uploads_path)), name="uploads")
+app.mount("/uploads", ImmutableStaticFiles(directory=str(uploads_path)), name="uploads")
@@ -1,3 +1,5 @@
+import os
+import time
 import uuid
 from datetime import datetime
 
@@ -5,6 +7,21 @@ from sqlalchemy import func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The leading 48 bits are the Unix time in milliseconds and the rest is
+    random, so ids created one after another sort together and new rows
+    land on the right edge of primary key and FK indexes instead of at
+    random pages, as uuid4 ids do.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class Base(DeclarativeBase):
     """
     Base model for all database tables.
@@ -18,11 +35,13 @@ class Base(DeclarativeBase):
     support should inherit from TenantBase instead.
     """
 
-    # Primary key
+    # Primary key, time-ordered for B-tree locality. Ids are generated in
+    # Python so they exist before flush; the server default (uuid-ossp, see
+    # migration 018) only covers rows inserted with raw SQL.
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=func.gen_random_uuid()
+        default=uuid7,
+        server_default=func.uuid_generate_v1mc()
     )
 
     # Timestamps
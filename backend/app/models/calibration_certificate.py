@@ -2,7 +2,7 @@ import uuid
 from datetime import date
 from typing import Optional
 
-from sqlalchemy import String, Date, UniqueConstraint
+from sqlalchemy import String, Date, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import TenantBase
@@ -14,10 +14,17 @@ class CalibrationCertificate(TenantBase):
     __tablename__ = "calibration_certificates"
     __table_args__ = (
         UniqueConstraint("tenant_id", "certificate_number", name="uq_tenant_certificate_number"),
+        Index(
+            "ix_calibration_certificates_tenant_active_expiry",
+            "tenant_id", "is_active", "expiry_date",
+        ),
     )
 
+    # Multi-tenant support - indexed through the composite index above
+    tenant_id: Mapped[uuid.UUID] = mapped_column(nullable=False)
+
     equipment_name: Mapped[str] = mapped_column(String(255), nullable=False)
-    certificate_number: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    certificate_number: Mapped[str] = mapped_column(String(100), nullable=False)
     manufacturer: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     model: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     serial_number: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
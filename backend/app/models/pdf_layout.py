@@ -32,5 +32,9 @@ class PdfLayout(Base):
         UniqueConstraint("tenant_id", "slug", name="uq_pdf_layout_tenant_slug"),
     )
 
+    # Fetch server-generated created_at/updated_at with RETURNING on flush,
+    # so the routes can serialize a written layout without a refresh query
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<PdfLayout(id={self.id}, slug={self.slug}, name={self.name})>"
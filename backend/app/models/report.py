@@ -1,8 +1,9 @@
 import uuid
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,12 +24,37 @@ class Report(TenantBase):
     """
 
     __tablename__ = "reports"
+    __table_args__ = (
+        Index(
+            "ix_reports_tenant_status_updated",
+            "tenant_id", "status", text("updated_at DESC"),
+        ),
+        Index(
+            "ix_reports_tenant_created",
+            "tenant_id", text("created_at DESC"),
+            postgresql_include=["status"],
+        ),
+        Index(
+            "ix_reports_open",
+            "tenant_id",
+            postgresql_where=text("status IN ('draft', 'in_progress')"),
+        ),
+        Index("ix_reports_tenant_template", "tenant_id", "template_id"),
+        Index("ix_reports_tenant_project", "tenant_id", "project_id"),
+        Index("ix_reports_tenant_user", "tenant_id", "user_id"),
+        Index(
+            "ix_reports_revision_parent",
+            "parent_report_id",
+            postgresql_where=text("parent_report_id IS NOT NULL"),
+        ),
+    )
+
+    # Multi-tenant support - indexed through the composite indexes above
+    tenant_id: Mapped[uuid.UUID] = mapped_column(nullable=False)
 
     # Report fields
     title: Mapped[str] = mapped_column(String(255), nullable=False)
-    status: Mapped[str] = mapped_column(
-        String(50), nullable=False, default="draft", index=True
-    )
+    status: Mapped[str] = mapped_column(String(50), nullable=False, default="draft")
     location: Mapped[str | None] = mapped_column(
         Text, nullable=True, comment="Geographic location as text (lat,lon)"
     )
@@ -45,7 +71,7 @@ class Report(TenantBase):
         Integer, nullable=False, default=0, server_default="0"
     )
     parent_report_id: Mapped[Optional[uuid.UUID]] = mapped_column(
-        ForeignKey("reports.id", ondelete="SET NULL"), nullable=True, index=True
+        ForeignKey("reports.id", ondelete="SET NULL"), nullable=True
     )
     revision_notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     is_latest_revision: Mapped[bool] = mapped_column(
@@ -54,10 +80,10 @@ class Report(TenantBase):
 
     # Foreign keys
     template_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("templates.id", ondelete="RESTRICT"), nullable=False, index=True
+        ForeignKey("templates.id", ondelete="RESTRICT"), nullable=False
     )
     project_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("projects.id", ondelete="RESTRICT"), nullable=False, index=True
+        ForeignKey("projects.id", ondelete="RESTRICT"), nullable=False
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True
@@ -98,6 +124,38 @@ class Report(TenantBase):
         cascade="all, delete-orphan",
         lazy="selectin"
     )
+    # tenant_id has no FK to tenants; read-only and only loaded on request
+    # (e.g. joinedload in the photo upload), never implicitly
+    tenant: Mapped["Tenant"] = relationship(
+        "Tenant",
+        primaryjoin="foreign(Report.tenant_id) == Tenant.id",
+        viewonly=True,
+        lazy="raise",
+    )
+
+    @cached_property
+    def photo_config_map(self) -> dict[str, dict]:
+        """
+        photo_config of every snapshot field, keyed by field id and by label.
+
+        The snapshot never changes after creation, so the map is built once
+        per loaded instance and each checklist response resolves its config
+        with a dict lookup instead of a walk over every section and field.
+        """
+        config_map: dict[str, dict] = {}
+        snapshot = self.template_snapshot
+        if not snapshot:
+            return config_map
+
+        for section in snapshot.get("sections", []):
+            for field in section.get("fields", []):
+                photo_config = field.get("photo_config") or {}
+                if field.get("id") is not None:
+                    config_map.setdefault(str(field["id"]), photo_config)
+                if field.get("label") is not None:
+                    config_map.setdefault(field["label"], photo_config)
+
+        return config_map
 
     def __repr__(self) -> str:
         return f"<Report(id={self.id}, title={self.title}, status={self.status}, rev={self.revision_number})>"
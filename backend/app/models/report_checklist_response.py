@@ -24,10 +24,22 @@ class ReportChecklistResponse(SimpleBase):
         ForeignKey("reports.id", ondelete="CASCADE"), nullable=False, index=True
     )
     section_id: Mapped[uuid.UUID | None] = mapped_column(
-        ForeignKey("template_sections.id", ondelete="SET NULL"), nullable=True
+        ForeignKey(
+            "template_sections.id",
+            ondelete="SET NULL",
+            deferrable=True,
+            initially="DEFERRED",
+        ),
+        nullable=True,
     )
     field_id: Mapped[uuid.UUID | None] = mapped_column(
-        ForeignKey("template_fields.id", ondelete="SET NULL"), nullable=True
+        ForeignKey(
+            "template_fields.id",
+            ondelete="SET NULL",
+            deferrable=True,
+            initially="DEFERRED",
+        ),
+        nullable=True,
     )
 
     # Denormalized for snapshot (template structure may change)
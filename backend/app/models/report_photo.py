@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import BigInteger, ForeignKey, String, Text
+from sqlalchemy import BigInteger, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -15,10 +15,16 @@ class ReportPhoto(Base):
     """
 
     __tablename__ = "report_photos"
+    __table_args__ = (
+        Index("ix_report_photos_report_tenant", "report_id", "tenant_id"),
+    )
+
+    # Denormalized from the parent report (covered by the composite index)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(nullable=False)
 
     # Photo metadata
     file_key: Mapped[str] = mapped_column(
-        String(500), nullable=False, unique=True, index=True
+        String(500), nullable=False, unique=True
     )
     original_filename: Mapped[str] = mapped_column(String(255), nullable=False)
     mime_type: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -31,7 +37,7 @@ class ReportPhoto(Base):
 
     # Foreign keys
     report_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("reports.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("reports.id", ondelete="CASCADE"), nullable=False
     )
 
     def __repr__(self) -> str:
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -17,6 +17,14 @@ class ReportSignature(Base):
     """
 
     __tablename__ = "report_signatures"
+    __table_args__ = (
+        Index("ix_report_signatures_report_tenant", "report_id", "tenant_id"),
+    )
+
+    # Denormalized from the parent report (covered by the composite index)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
+    )
 
     # Signature metadata
     role_name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -32,7 +40,7 @@ class ReportSignature(Base):
 
     # Foreign keys
     report_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("reports.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("reports.id", ondelete="CASCADE"), nullable=False
     )
     signature_field_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("template_signature_fields.id", ondelete="SET NULL"),
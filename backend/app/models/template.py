@@ -34,7 +34,7 @@ class Template(TenantBase):
 
     # PDF Layout override
     pdf_layout_id: Mapped[uuid.UUID | None] = mapped_column(
-        ForeignKey("pdf_layouts.id", ondelete="SET NULL"), nullable=True
+        ForeignKey("pdf_layouts.id", ondelete="SET NULL"), index=True, nullable=True
     )
 
     # Relationships - order_by deferred to query time since using forward refs
@@ -21,7 +21,7 @@ class Tenant(Base):
 
     # Tenant-specific fields
     name: Mapped[str] = mapped_column(String(255), nullable=False)
-    slug: Mapped[str] = mapped_column(String(100), unique=True, nullable=False, index=True)
+    slug: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     is_active: Mapped[bool] = mapped_column(default=True, nullable=False)
 
     # Branding fields (for TNNT-03 and TNNT-04)
@@ -45,7 +45,7 @@ class Tenant(Base):
 
     # PDF Layout preference
     default_pdf_layout_id: Mapped[Optional[uuid.UUID]] = mapped_column(
-        ForeignKey("pdf_layouts.id", ondelete="SET NULL"), nullable=True
+        ForeignKey("pdf_layouts.id", ondelete="SET NULL"), index=True, nullable=True
     )
 
     # Relationships
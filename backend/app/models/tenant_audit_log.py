@@ -8,7 +8,7 @@ Not tenant-scoped via TenantBase (references tenant_id as FK directly).
 import uuid
 from typing import Optional
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -24,13 +24,20 @@ class TenantAuditLog(Base):
     """
 
     __tablename__ = "tenant_audit_logs"
+    __table_args__ = (
+        # Audit log listing: one tenant, newest first
+        Index(
+            "ix_tenant_audit_logs_tenant_created",
+            "tenant_id", text("created_at DESC"),
+        ),
+    )
 
     # Foreign keys
     tenant_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("tenants.id", ondelete="CASCADE"), index=True, nullable=False
+        ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False
     )
     admin_user_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("users.id", ondelete="RESTRICT"), nullable=False
+        ForeignKey("users.id", ondelete="RESTRICT"), index=True, nullable=False
     )
 
     # Action details
@@ -12,7 +12,7 @@ Role Hierarchy:
 import uuid
 from typing import Optional
 
-from sqlalchemy import String, CheckConstraint
+from sqlalchemy import Enum, String, CheckConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -40,10 +40,21 @@ class User(Base):
     )
 
     # User fields
-    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)
-    role: Mapped[str] = mapped_column(String(50), nullable=False, default="technician")
+    role: Mapped[str] = mapped_column(
+        Enum(
+            "superadmin",
+            "tenant_admin",
+            "project_manager",
+            "technician",
+            "viewer",
+            name="user_role",
+        ),
+        nullable=False,
+        default="technician",
+    )
     is_active: Mapped[bool] = mapped_column(default=True, nullable=False)
 
     # Database-level constraint to enforce role/tenant_id relationship
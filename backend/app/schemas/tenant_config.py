@@ -146,6 +146,13 @@ class TenantWithConfigResponse(BaseModel):
         from_attributes = True
 
 
+class TenantWithConfigListResponse(BaseModel):
+    """Schema for paginated tenant list with config and usage stats."""
+    items: list[TenantWithConfigResponse]
+    total: int
+    page: int
+
+
 # --- Audit log schemas ---
 
 class TenantAuditLogResponse(BaseModel):
@@ -161,3 +168,10 @@ class TenantAuditLogResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class TenantAuditLogListResponse(BaseModel):
+    """Schema for paginated audit log list."""
+    items: list[TenantAuditLogResponse]
+    total: int
+    page: int
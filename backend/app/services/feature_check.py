@@ -5,8 +5,13 @@ Resolves feature flags through the chain:
 1. TenantConfig.features_json (per-tenant override)
 2. TenantPlan.features_json (plan default)
 3. Default: False
+
+check_feature_cached() serves repeat checks from an in-process TTL cache;
+routes that write features_json call invalidate_feature_cache() after commit.
 """
 
+import time
+from collections import OrderedDict
 from uuid import UUID
 
 from sqlalchemy import select
@@ -15,6 +20,12 @@ from sqlalchemy.orm import selectinload
 
 from app.models.tenant_config import TenantConfig
 
+# Feature flags change on plan/config edits, not per request. Entries expire
+# after the TTL, which also bounds staleness on other worker processes.
+FEATURE_CACHE_TTL_SECONDS = 60
+FEATURE_CACHE_MAX_SIZE = 4096
+_feature_cache: "OrderedDict[tuple[UUID, str], tuple[float, bool]]" = OrderedDict()
+
 
 async def check_feature(db: AsyncSession, tenant_id: UUID, feature: str) -> bool:
     """
@@ -53,3 +64,44 @@ async def check_feature(db: AsyncSession, tenant_id: UUID, feature: str) -> bool
 
     # 3. Default
     return False
+
+
+async def check_feature_cached(db: AsyncSession, tenant_id: UUID, feature: str) -> bool:
+    """
+    check_feature(), answered from the cache when possible.
+
+    Args:
+        db: Database session (used on cache misses only)
+        tenant_id: Tenant UUID
+        feature: Feature name (e.g., "custom_pdf")
+
+    Returns:
+        True if feature is enabled
+    """
+    key = (tenant_id, feature)
+    entry = _feature_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        _feature_cache.move_to_end(key)
+        return entry[1]
+
+    enabled = await check_feature(db, tenant_id, feature)
+    _feature_cache[key] = (time.monotonic() + FEATURE_CACHE_TTL_SECONDS, enabled)
+    _feature_cache.move_to_end(key)
+    if len(_feature_cache) > FEATURE_CACHE_MAX_SIZE:
+        _feature_cache.popitem(last=False)
+    return enabled
+
+
+def invalidate_feature_cache(tenant_id: UUID | None = None) -> None:
+    """
+    Drop cached feature flags after they change.
+
+    Args:
+        tenant_id: Tenant whose config changed, or None for every tenant
+            (e.g. after a plan's defaults change)
+    """
+    if tenant_id is None:
+        _feature_cache.clear()
+        return
+    for key in [key for key in _feature_cache if key[0] == tenant_id]:
+        del _feature_cache[key]
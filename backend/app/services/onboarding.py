@@ -12,6 +12,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.fixtures.demo_template import DEMO_TEMPLATE
+from app.models.base import uuid7
 from app.models.template import Template
 from app.models.template_field import TemplateField
 from app.models.template_section import TemplateSection
@@ -44,7 +45,7 @@ class OnboardingService:
         onboarding = result.scalar_one_or_none()
         if onboarding is None:
             onboarding = TenantOnboarding(
-                id=uuid.uuid4(),
+                id=uuid7(),
                 tenant_id=tenant_id,
             )
             db.add(onboarding)
@@ -121,7 +122,7 @@ class OnboardingService:
 
         # Create template from fixture
         template = Template(
-            id=uuid.uuid4(),
+            id=uuid7(),
             tenant_id=tenant_id,
             name=DEMO_TEMPLATE["name"],
             code=DEMO_TEMPLATE["code"],
@@ -137,7 +138,7 @@ class OnboardingService:
         # Create sections and fields
         for section_data in DEMO_TEMPLATE["sections"]:
             section = TemplateSection(
-                id=uuid.uuid4(),
+                id=uuid7(),
                 template_id=template.id,
                 name=section_data["name"],
                 order=section_data["order"],
@@ -147,7 +148,7 @@ class OnboardingService:
 
             for field_data in section_data["fields"]:
                 field = TemplateField(
-                    id=uuid.uuid4(),
+                    id=uuid7(),
                     section_id=section.id,
                     label=field_data["label"],
                     field_type=field_data["field_type"],
@@ -0,0 +1,96 @@
+"""
+In-process cache of active PDF layouts.
+
+Layouts are read on every template/report screen but change rarely:
+system layouts only through scripts/seed_pdf_layouts.py, custom layouts
+through the pdf-layouts routes, which invalidate their tenant's entry.
+Entries expire after LAYOUT_CACHE_TTL_SECONDS, which bounds staleness for
+changes made by other workers or by the seed script.
+
+Cached values are validated PdfLayoutResponse models, never ORM instances,
+so they are safe to share across requests and sessions.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.pdf_layout import PdfLayout
+from app.schemas.pdf_layout import PdfLayoutResponse
+
+LAYOUT_CACHE_TTL_SECONDS = 300
+LAYOUT_CACHE_MAX_SIZE = 512
+
+# Key for the system layouts; tenant layouts are keyed by tenant id
+SYSTEM_LAYOUTS_KEY = "system"
+
+_cache: "OrderedDict[str | UUID, tuple[float, list[PdfLayoutResponse]]]" = OrderedDict()
+# One lock per cache key, so a miss only waits on misses for the same key
+_locks: dict[str | UUID, asyncio.Lock] = {}
+
+
+async def _load(
+    db: AsyncSession, key: str | UUID
+) -> list[PdfLayoutResponse]:
+    """Return the active layouts for a cache key, querying on a miss."""
+    entry = _cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        _cache.move_to_end(key)
+        return entry[1]
+
+    # One query per key at a time: concurrent misses wait for the first
+    async with _locks.setdefault(key, asyncio.Lock()):
+        entry = _cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        owner = (
+            PdfLayout.tenant_id.is_(None)
+            if key == SYSTEM_LAYOUTS_KEY
+            else PdfLayout.tenant_id == key
+        )
+        result = await db.execute(
+            select(PdfLayout).where(PdfLayout.is_active == True, owner)
+        )
+        layouts = [
+            PdfLayoutResponse.model_validate(layout)
+            for layout in result.scalars().all()
+        ]
+
+        _cache[key] = (time.monotonic() + LAYOUT_CACHE_TTL_SECONDS, layouts)
+        _cache.move_to_end(key)
+        if len(_cache) > LAYOUT_CACHE_MAX_SIZE:
+            evicted, _ = _cache.popitem(last=False)
+            _locks.pop(evicted, None)
+        return layouts
+
+
+async def get_active_layouts(
+    db: AsyncSession, tenant_id: UUID
+) -> list[PdfLayoutResponse]:
+    """
+    Get the active layouts available to a tenant: system layouts first,
+    then the tenant's custom layouts, each by name.
+
+    Args:
+        db: Database session (used on cache misses only)
+        tenant_id: Tenant UUID
+
+    Returns:
+        List of layouts (shared; do not mutate)
+    """
+    system_layouts = await _load(db, SYSTEM_LAYOUTS_KEY)
+    tenant_layouts = await _load(db, tenant_id)
+    return sorted(
+        system_layouts + tenant_layouts,
+        key=lambda layout: (not layout.is_system, layout.name),
+    )
+
+
+def invalidate_tenant_layouts(tenant_id: UUID) -> None:
+    """Drop a tenant's cached custom layouts after one is changed."""
+    _cache.pop(tenant_id, None)
@@ -6,6 +6,10 @@ import uuid
 from pathlib import Path
 from typing import BinaryIO, Optional
 
+# Objects are stored under fresh UUID names and never rewritten (a new
+# upload gets a new key), so clients and the CDN edge may cache them forever
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
 
 class StorageService:
     """
@@ -92,7 +96,7 @@ class StorageService:
                 path,
                 ExtraArgs={
                     "ContentType": content_type,
-                    "CacheControl": "public, max-age=31536000",
+                    "CacheControl": IMMUTABLE_CACHE_CONTROL,
                 },
             )
             # Build public URL
@@ -5,14 +5,14 @@ Provides transactional operations for creating, suspending, activating,
 and configuring tenants with full audit logging.
 """
 
-import asyncio
 import uuid
 from datetime import datetime, timedelta, timezone
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import hash_password
+from app.core.security import hash_password_async
+from app.models.base import uuid7
 from app.models.tenant import Tenant
 from app.models.tenant_audit_log import TenantAuditLog
 from app.models.tenant_config import TenantConfig
@@ -62,7 +62,7 @@ class TenantProvisioningService:
 
         # 2. Create tenant
         tenant = Tenant(
-            id=uuid.uuid4(),
+            id=uuid7(),
             name=name,
             slug=slug,
             is_active=True,
@@ -73,7 +73,7 @@ class TenantProvisioningService:
         # 3. Create tenant config
         trial_ends = datetime.now(timezone.utc) + timedelta(days=trial_days) if trial_days > 0 else None
         config = TenantConfig(
-            id=uuid.uuid4(),
+            id=uuid7(),
             tenant_id=tenant.id,
             plan_id=plan.id,
             status="trial" if trial_days > 0 else "active",
@@ -84,10 +84,10 @@ class TenantProvisioningService:
         )
         db.add(config)
 
-        # 4. Create admin user (hash_password is CPU-intensive, run in threadpool)
-        hashed = await asyncio.to_thread(hash_password, admin_password)
+        # 4. Create admin user (hashing is CPU-intensive, run on the Argon2 pool)
+        hashed = await hash_password_async(admin_password)
         admin_user = User(
-            id=uuid.uuid4(),
+            id=uuid7(),
             tenant_id=tenant.id,
             email=admin_email,
             password_hash=hashed,
@@ -99,14 +99,14 @@ class TenantProvisioningService:
 
         # 5. Create onboarding record
         onboarding = TenantOnboarding(
-            id=uuid.uuid4(),
+            id=uuid7(),
             tenant_id=tenant.id,
         )
         db.add(onboarding)
 
         # 6. Audit log
         audit = TenantAuditLog(
-            id=uuid.uuid4(),
+            id=uuid7(),
             tenant_id=tenant.id,
             admin_user_id=created_by_user_id,
             action="tenant_created",
@@ -156,7 +156,7 @@ class TenantProvisioningService:
         config.suspended_reason = reason
 
         audit = TenantAuditLog(
-            id=uuid.uuid4(),
+            id=uuid7(),
             tenant_id=tenant_id,
             admin_user_id=suspended_by_user_id,
             action="tenant_suspended",
@@ -192,7 +192,7 @@ class TenantProvisioningService:
         config.suspended_reason = None
 
         audit = TenantAuditLog(
-            id=uuid.uuid4(),
+            id=uuid7(),
             tenant_id=tenant_id,
             admin_user_id=activated_by_user_id,
             action="tenant_activated",
@@ -221,7 +221,7 @@ class TenantProvisioningService:
         config.limits_json = limits
 
         audit = TenantAuditLog(
-            id=uuid.uuid4(),
+            id=uuid7(),
             tenant_id=tenant_id,
             admin_user_id=updated_by_user_id,
             action="limits_updated",
@@ -250,7 +250,7 @@ class TenantProvisioningService:
         config.features_json = features
 
         audit = TenantAuditLog(
-            id=uuid.uuid4(),
+            id=uuid7(),
             tenant_id=tenant_id,
             admin_user_id=updated_by_user_id,
             action="features_updated",
@@ -296,7 +296,7 @@ class TenantProvisioningService:
         config.features_json = plan.features_json
 
         audit = TenantAuditLog(
-            id=uuid.uuid4(),
+            id=uuid7(),
             tenant_id=tenant_id,
             admin_user_id=assigned_by_user_id,
             action="plan_changed",
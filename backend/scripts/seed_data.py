@@ -973,6 +973,7 @@ async def seed_reports(
     # Add signature for completed report
     r3_sig = ReportSignature(
         id=uuid.uuid4(),
+        tenant_id=r3.tenant_id,
         report_id=r3.id,
         signature_field_id=ce_data["signature_fields"][0].id,
         role_name="Tecnico Responsavel",
@@ -1041,6 +1042,7 @@ async def seed_reports(
 
     r5_sig = ReportSignature(
         id=uuid.uuid4(),
+        tenant_id=r5.tenant_id,
         report_id=r5.id,
         signature_field_id=av_data["signature_fields"][0].id,
         role_name="Analista de Vibracoes",
@@ -129,17 +129,20 @@ async def main() -> None:
         created = 0
         skipped = 0
 
-        for layout_data in LAYOUTS:
-            # Check if layout with this slug already exists (system layouts have tenant_id=NULL)
-            result = await session.execute(
-                select(PdfLayout).where(
-                    PdfLayout.slug == layout_data["slug"],
-                    PdfLayout.tenant_id.is_(None),
-                )
+        # Look up all existing system layouts (tenant_id=NULL) in one query
+        # instead of one per layout
+        result = await session.execute(
+            select(PdfLayout.slug, PdfLayout.id).where(
+                PdfLayout.slug.in_([layout_data["slug"] for layout_data in LAYOUTS]),
+                PdfLayout.tenant_id.is_(None),
             )
-            existing = result.scalar_one_or_none()
-            if existing:
-                print(f"  SKIP: '{layout_data['name']}' already exists (id={existing.id})")
+        )
+        existing_ids = dict(result.all())
+
+        for layout_data in LAYOUTS:
+            existing_id = existing_ids.get(layout_data["slug"])
+            if existing_id:
+                print(f"  SKIP: '{layout_data['name']}' already exists (id={existing_id})")
                 skipped += 1
                 continue
 
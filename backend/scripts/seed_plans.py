@@ -103,14 +103,18 @@ async def main() -> None:
         created = 0
         skipped = 0
 
-        for plan_data in PLANS:
-            # Check if plan with this name already exists
-            result = await session.execute(
-                select(TenantPlan).where(TenantPlan.name == plan_data["name"])
+        # Look up all existing plans in one query instead of one per plan
+        result = await session.execute(
+            select(TenantPlan.name, TenantPlan.id).where(
+                TenantPlan.name.in_([plan_data["name"] for plan_data in PLANS])
             )
-            existing = result.scalar_one_or_none()
-            if existing:
-                print(f"  SKIP: '{plan_data['name']}' already exists (id={existing.id})")
+        )
+        existing_ids = dict(result.all())
+
+        for plan_data in PLANS:
+            existing_id = existing_ids.get(plan_data["name"])
+            if existing_id:
+                print(f"  SKIP: '{plan_data['name']}' already exists (id={existing_id})")
                 skipped += 1
                 continue
 
@@ -0,0 +1,119 @@
+"""
+Tests for the dashboard metrics endpoint.
+
+Covers the response shape, tenant scoping and the ETag / 304 path.
+"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factories import create_template, create_project, create_report
+
+
+METRICS_URL = "/api/v1/dashboard/metrics"
+
+
+@pytest.mark.asyncio
+async def test_dashboard_metrics_shape(
+    admin_client: AsyncClient,
+    db_session: AsyncSession,
+    test_tenant,
+    tenant_admin_user,
+):
+    """GET /dashboard/metrics returns every metric for the tenant's reports."""
+    template = await create_template(db_session, test_tenant.id)
+    project = await create_project(db_session, test_tenant.id)
+    await create_report(db_session, test_tenant.id, template, project, tenant_admin_user)
+
+    resp = await admin_client.get(METRICS_URL)
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+
+    assert set(body) == {
+        "reports_by_status",
+        "reports_by_month",
+        "reports_by_template",
+        "reports_by_user",
+        "reports_by_project",
+        "avg_completion_hours",
+        "total_reports",
+        "total_photos",
+        "certificate_stats",
+    }
+    assert body["total_reports"] == 1
+    assert body["reports_by_status"] == [{"status": "draft", "count": 1}]
+    assert sum(m["count"] for m in body["reports_by_month"]) == 1
+    assert body["avg_completion_hours"] is None
+    assert body["total_photos"] == 0
+    assert body["certificate_stats"] == {"total": 0, "expiring_in_30_days": 0, "expired": 0}
+    assert resp.headers["etag"]
+
+
+@pytest.mark.asyncio
+async def test_dashboard_metrics_not_modified(
+    admin_client: AsyncClient,
+    db_session: AsyncSession,
+    test_tenant,
+    tenant_admin_user,
+):
+    """A matching If-None-Match gets an empty 304."""
+    first = await admin_client.get(METRICS_URL)
+    assert first.status_code == 200
+
+    resp = await admin_client.get(
+        METRICS_URL, headers={"If-None-Match": first.headers["etag"]}
+    )
+    assert resp.status_code == 304
+    assert resp.content == b""
+
+
+@pytest.mark.asyncio
+async def test_dashboard_metrics_breakdowns(
+    admin_client: AsyncClient,
+    db_session: AsyncSession,
+    test_tenant,
+    second_tenant,
+    tenant_admin_user,
+    technician_user,
+):
+    """Each breakdown counts the tenant's reports by its own dimension."""
+    alpha = await create_template(db_session, test_tenant.id, name="Alpha")
+    beta = await create_template(db_session, test_tenant.id, name="Beta")
+    project_a = await create_project(db_session, test_tenant.id, name="Projeto A")
+    project_b = await create_project(db_session, test_tenant.id, name="Projeto B")
+
+    await create_report(db_session, test_tenant.id, alpha, project_a, tenant_admin_user)
+    await create_report(db_session, test_tenant.id, alpha, project_b, tenant_admin_user)
+    await create_report(
+        db_session, test_tenant.id, beta, project_b, technician_user, status="completed"
+    )
+
+    # Another tenant's report must not show up anywhere
+    other_template = await create_template(db_session, second_tenant.id, name="Alpha")
+    other_project = await create_project(db_session, second_tenant.id, name="Projeto A")
+    await create_report(
+        db_session, second_tenant.id, other_template, other_project, tenant_admin_user
+    )
+
+    resp = await admin_client.get(METRICS_URL)
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+
+    assert body["total_reports"] == 3
+    assert sorted(body["reports_by_status"], key=lambda s: s["status"]) == [
+        {"status": "completed", "count": 1},
+        {"status": "draft", "count": 2},
+    ]
+    assert body["reports_by_template"] == [
+        {"template_name": "Alpha", "count": 2},
+        {"template_name": "Beta", "count": 1},
+    ]
+    assert body["reports_by_user"] == [
+        {"user_id": str(tenant_admin_user.id), "user_name": "Tenant Admin", "count": 2},
+        {"user_id": str(technician_user.id), "user_name": "Tech User", "count": 1},
+    ]
+    assert body["reports_by_project"] == [
+        {"project_id": str(project_b.id), "project_name": "Projeto B", "count": 2},
+        {"project_id": str(project_a.id), "project_name": "Projeto A", "count": 1},
+    ]
+    assert sum(m["count"] for m in body["reports_by_month"]) == 3
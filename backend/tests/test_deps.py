@@ -0,0 +1,69 @@
+"""
+Tests for the get_current_user user cache.
+"""
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import deps
+from app.core.deps import get_current_user, invalidate_cached_user
+from app.core.security import create_access_token
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    """Each test starts and ends with an empty user cache."""
+    deps._user_cache.clear()
+    yield
+    deps._user_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_user_cache_keeps_auth_columns_only(db_session: AsyncSession, technician_user):
+    """The cache holds the columns auth needs, never the password hash."""
+    token = create_access_token({"sub": str(technician_user.id)})
+
+    user = await get_current_user(token, db_session)
+
+    assert user.id == technician_user.id
+    _, values = deps._user_cache[str(technician_user.id)]
+    assert set(values) == set(deps._USER_COLUMNS)
+    assert "password_hash" not in values
+
+
+@pytest.mark.asyncio
+async def test_user_cache_hit_skips_the_query(
+    db_session: AsyncSession, technician_user, monkeypatch
+):
+    """A cached user is returned without querying the users table."""
+    token = create_access_token({"sub": str(technician_user.id)})
+    await get_current_user(token, db_session)
+
+    async def no_queries(*args, **kwargs):
+        raise AssertionError("cached user should not be queried")
+
+    monkeypatch.setattr(db_session, "execute", no_queries)
+    user = await get_current_user(token, db_session)
+
+    assert user.id == technician_user.id
+    assert user.role == "technician"
+    assert user.is_active is True
+
+
+@pytest.mark.asyncio
+async def test_invalidate_cached_user_rejects_deactivated_user(
+    db_session: AsyncSession, technician_user
+):
+    """After invalidation the next request re-reads the user and sees is_active."""
+    token = create_access_token({"sub": str(technician_user.id)})
+    await get_current_user(token, db_session)
+
+    technician_user.is_active = False
+    await db_session.flush()
+    invalidate_cached_user(technician_user.id)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(token, db_session)
+
+    assert exc_info.value.status_code == 401
+    assert deps._user_cache[str(technician_user.id)][1]["is_active"] is False
@@ -0,0 +1,32 @@
+from app.core.http_cache import etag_matches, make_etag, not_modified
+
+
+def test_make_etag_is_stable_and_quoted():
+    """The same fingerprint gives the same strong ETag; a change gives another."""
+    etag = make_etag("tenant", 3, "2026-10-15 12:00:00")
+
+    assert etag == make_etag("tenant", 3, "2026-10-15 12:00:00")
+    assert etag != make_etag("tenant", 4, "2026-10-15 12:00:00")
+    assert etag.startswith('"') and etag.endswith('"')
+
+
+def test_etag_matches_lists_and_weak_tags():
+    """If-None-Match may list several tags, weak or strong, or be '*'."""
+    etag = make_etag("x")
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_not_modified_has_no_body():
+    """The 304 carries the ETag and cache policy but no body."""
+    etag = make_etag("x")
+    response = not_modified(etag)
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == "private, no-cache"
@@ -0,0 +1,25 @@
+import time
+import uuid
+
+from app.models.base import uuid7
+
+
+def test_uuid7_is_version_7():
+    """Ids carry the version 7 nibble and the RFC 4122 variant."""
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_leads_with_the_millisecond_timestamp():
+    """The top 48 bits are the creation time, so later ids sort after earlier ones."""
+    before = time.time_ns() // 1_000_000
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert before <= first.int >> 80 <= after
+    assert first < second
+    assert len({uuid7() for _ in range(1000)}) == 1000
@@ -0,0 +1,64 @@
+"""
+Tests for the PDF layout routes and their in-process cache.
+"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.tenant_config import TenantConfig
+from app.services import pdf_layout_cache
+from app.services.feature_check import invalidate_feature_cache
+
+
+LAYOUTS_URL = "/api/v1/pdf-layouts"
+
+
+@pytest.fixture(autouse=True)
+def clear_layout_cache():
+    """Each test starts and ends with an empty layout cache."""
+    pdf_layout_cache._cache.clear()
+    yield
+    pdf_layout_cache._cache.clear()
+
+
+async def _enable_custom_pdf(db: AsyncSession, tenant_id) -> None:
+    """Turn on the custom_pdf feature for a tenant."""
+    db.add(TenantConfig(tenant_id=tenant_id, features_json={"custom_pdf": True}))
+    await db.flush()
+    invalidate_feature_cache(tenant_id)
+
+
+async def _layout_names(client: AsyncClient) -> list[str]:
+    resp = await client.get(f"{LAYOUTS_URL}/")
+    assert resp.status_code == 200, resp.text
+    return [layout["name"] for layout in resp.json()["layouts"]]
+
+
+@pytest.mark.asyncio
+async def test_layout_cache_invalidated_on_changes(
+    admin_client: AsyncClient,
+    db_session: AsyncSession,
+    test_tenant,
+):
+    """Create, update and delete each show up in the next (cached) listing."""
+    await _enable_custom_pdf(db_session, test_tenant.id)
+
+    # Warm the cache with the empty listing
+    assert await _layout_names(admin_client) == []
+
+    resp = await admin_client.post(
+        f"{LAYOUTS_URL}/", json={"name": "Relatorio A", "slug": "relatorio-a"}
+    )
+    assert resp.status_code == 201, resp.text
+    layout_id = resp.json()["id"]
+    assert await _layout_names(admin_client) == ["Relatorio A"]
+
+    resp = await admin_client.patch(
+        f"{LAYOUTS_URL}/{layout_id}", json={"name": "Relatorio B"}
+    )
+    assert resp.status_code == 200, resp.text
+    assert await _layout_names(admin_client) == ["Relatorio B"]
+
+    resp = await admin_client.delete(f"{LAYOUTS_URL}/{layout_id}")
+    assert resp.status_code == 204, resp.text
+    assert await _layout_names(admin_client) == []
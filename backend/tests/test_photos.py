@@ -0,0 +1,272 @@
+"""
+Tests for the photo endpoints.
+
+Storage is replaced by an in-memory fake; the database is the test session.
+"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.routes import photos
+from app.models.report import Report
+from app.models.report_checklist_response import ReportChecklistResponse
+from tests.factories import create_template, create_project, create_report
+
+
+# PNG signature followed by filler: passes the magic-byte check, and the
+# watermark step fails on it and falls back to the original bytes
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+
+class FakeStorage:
+    """Records uploads and deletions instead of touching R2 or disk."""
+
+    def __init__(self):
+        self.deleted: list[str] = []
+
+    def upload_photo(self, **kwargs):
+        return "/uploads/photo.png", "photo.png"
+
+    def delete_object(self, object_key: str) -> bool:
+        self.deleted.append(object_key)
+        return True
+
+
+@pytest.fixture
+def fake_storage(monkeypatch) -> FakeStorage:
+    storage = FakeStorage()
+    monkeypatch.setattr(photos, "get_storage_service", lambda: storage)
+    return storage
+
+
+async def _make_response(
+    db: AsyncSession, report: Report, photo_list: list[dict]
+) -> ReportChecklistResponse:
+    """Add a checklist response for the snapshot's "Check Item 2" (max 3 photos)."""
+    response = ReportChecklistResponse(
+        report_id=report.id,
+        section_name="Test Section",
+        field_label="Check Item 2",
+        field_type="text",
+        photos=photo_list,
+    )
+    db.add(response)
+    await db.flush()
+    return response
+
+
+def _photo(photo_id: str) -> dict:
+    return {"id": photo_id, "url": f"/uploads/{photo_id}.jpg"}
+
+
+def _change_during_upload(monkeypatch, db: AsyncSession, storage: FakeStorage, statement):
+    """Run statement right after the photo is stored, as a concurrent request would."""
+    async def run(func, *args, **kwargs):
+        result = func(*args, **kwargs)
+        if func == storage.upload_photo:
+            await db.execute(statement)
+        return result
+
+    monkeypatch.setattr(photos, "run_in_threadpool", run)
+
+
+async def _upload(client: AsyncClient, report: Report, response: ReportChecklistResponse):
+    return await client.post(
+        f"/api/v1/reports/{report.id}/photos",
+        data={"response_id": str(response.id)},
+        files={"file": ("photo.png", PNG_BYTES, "image/png")},
+    )
+
+
+# ---------------------------------------------------------------------------
+# Upload re-checks after storing
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_upload_rejected_when_report_completed_meanwhile(
+    tech_client: AsyncClient,
+    db_session: AsyncSession,
+    test_tenant,
+    technician_user,
+    fake_storage,
+    monkeypatch,
+):
+    """A report completed during the upload gets the 400 and the object is removed."""
+    template = await create_template(db_session, test_tenant.id)
+    project = await create_project(db_session, test_tenant.id)
+    report = await create_report(db_session, test_tenant.id, template, project, technician_user)
+    response = await _make_response(db_session, report, [])
+
+    _change_during_upload(
+        monkeypatch, db_session, fake_storage,
+        update(Report).where(Report.id == report.id).values(status="completed"),
+    )
+    resp = await _upload(tech_client, report, response)
+
+    assert resp.status_code == 400
+    assert resp.json() == {"detail": "Cannot add photos to completed or archived reports"}
+    assert fake_storage.deleted == ["photo.png"]
+
+
+@pytest.mark.asyncio
+async def test_upload_rejected_when_field_filled_meanwhile(
+    tech_client: AsyncClient,
+    db_session: AsyncSession,
+    test_tenant,
+    technician_user,
+    fake_storage,
+    monkeypatch,
+):
+    """Photos added by another upload count against the field's limit."""
+    template = await create_template(db_session, test_tenant.id)
+    project = await create_project(db_session, test_tenant.id)
+    report = await create_report(db_session, test_tenant.id, template, project, technician_user)
+    response = await _make_response(db_session, report, [_photo("a"), _photo("b")])
+
+    _change_during_upload(
+        monkeypatch, db_session, fake_storage,
+        update(ReportChecklistResponse)
+        .where(ReportChecklistResponse.id == response.id)
+        .values(photos=[_photo("a"), _photo("b"), _photo("c")]),
+    )
+    resp = await _upload(tech_client, report, response)
+
+    assert resp.status_code == 400
+    assert resp.json() == {"detail": "Maximum 3 photos allowed for this field"}
+    assert fake_storage.deleted == ["photo.png"]
+
+
+@pytest.mark.asyncio
+async def test_upload_appends_photo(
+    tech_client: AsyncClient,
+    db_session: AsyncSession,
+    test_tenant,
+    technician_user,
+    fake_storage,
+):
+    """Without a concurrent change the photo is appended and nothing is deleted."""
+    template = await create_template(db_session, test_tenant.id)
+    project = await create_project(db_session, test_tenant.id)
+    report = await create_report(db_session, test_tenant.id, template, project, technician_user)
+    response = await _make_response(db_session, report, [_photo("a")])
+
+    resp = await _upload(tech_client, report, response)
+
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["photo"]["url"] == "/uploads/photo.png"
+    await db_session.refresh(response, ["photos"])
+    assert [p["id"] for p in response.photos][0] == "a"
+    assert len(response.photos) == 2
+    assert fake_storage.deleted == []
+
+
+# ---------------------------------------------------------------------------
+# Delete
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_remove_photo_statement_keeps_order_and_returns_url(
+    db_session: AsyncSession, test_tenant, technician_user
+):
+    """Removing the middle photo keeps the others in order and returns its URL."""
+    template = await create_template(db_session, test_tenant.id)
+    project = await create_project(db_session, test_tenant.id)
+    report = await create_report(db_session, test_tenant.id, template, project, technician_user)
+    response = await _make_response(
+        db_session, report, [_photo("a"), _photo("b"), _photo("c")]
+    )
+
+    result = await db_session.execute(photos._remove_photo_statement(report.id, "b"))
+    assert result.one().url == "/uploads/b.jpg"
+
+    await db_session.refresh(response, ["photos"])
+    assert response.photos == [_photo("a"), _photo("c")]
+
+    result = await db_session.execute(photos._remove_photo_statement(report.id, "b"))
+    assert result.first() is None
+
+
+@pytest.mark.asyncio
+async def test_delete_photo(
+    tech_client: AsyncClient,
+    db_session: AsyncSession,
+    test_tenant,
+    technician_user,
+    fake_storage,
+):
+    """DELETE removes photos one by one, 404s on unknown ids and leaves []."""
+    template = await create_template(db_session, test_tenant.id)
+    project = await create_project(db_session, test_tenant.id)
+    report = await create_report(db_session, test_tenant.id, template, project, technician_user)
+    response = await _make_response(
+        db_session, report, [_photo("a"), _photo("b"), _photo("c")]
+    )
+    url = f"/api/v1/reports/{report.id}/photos"
+
+    resp = await tech_client.delete(f"{url}/b")
+    assert resp.status_code == 200, resp.text
+    await db_session.refresh(response, ["photos"])
+    assert response.photos == [_photo("a"), _photo("c")]
+    assert fake_storage.deleted == ["b.jpg"]
+
+    resp = await tech_client.delete(f"{url}/unknown")
+    assert resp.status_code == 404
+    assert resp.json() == {"detail": "Photo not found"}
+
+    for photo_id in ("a", "c"):
+        resp = await tech_client.delete(f"{url}/{photo_id}")
+        assert resp.status_code == 200, resp.text
+
+    await db_session.refresh(response, ["photos"])
+    assert response.photos == []
+    assert fake_storage.deleted == ["b.jpg", "a.jpg", "c.jpg"]
+
+
+# ---------------------------------------------------------------------------
+# Magic-byte sniffing
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "head, expected",
+    [
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF\x00", "image/jpeg"),
+        (b"\xff\xd8\xff\xe1\x00\x10Exif\x00", "image/jpeg"),
+        (b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", "image/png"),
+        (b"RIFF\x24\x00\x00\x00WEBPVP8 ", "image/webp"),
+        (b"GIF87a\x01\x00\x01\x00", "image/gif"),
+        (b"GIF89a\x01\x00\x01\x00", "image/gif"),
+    ]
+    + [
+        (b"\x00\x00\x00\x18ftyp" + brand + b"\x00\x00\x00\x00", "image/heic")
+        for brand in sorted(photos.HEIF_BRANDS)
+    ],
+)
+def test_sniff_image_type_accepts_supported_formats(head, expected):
+    """Each supported format is recognised from its signature."""
+    assert photos._sniff_image_type(head) == expected
+
+
+@pytest.mark.parametrize(
+    "head",
+    [
+        b"",
+        b"\xff\xd8",  # truncated JPEG
+        b"\x89PNG",  # truncated PNG
+        b"RIFF\x24\x00\x00\x00",  # RIFF without the WEBP form type
+        b"\x00\x00\x00\x18ftyp",  # ftyp without a brand
+        b"RIFF\x24\x00\x00\x00WAVEfmt ",  # RIFF audio
+        b"\x00\x00\x00\x18ftypisom\x00\x00\x00\x00",  # MP4 video
+        b"BM6\x00\x00\x00\x00\x00\x00\x006\x00",  # BMP
+        b"II*\x00\x08\x00\x00\x00",  # TIFF, little-endian
+        b"MM\x00*\x00\x00\x00\x08",  # TIFF, big-endian
+        b"%PDF-1.7\n",
+        b"<svg xmlns=",
+    ],
+)
+def test_sniff_image_type_rejects_other_content(head):
+    """Truncated headers and unsupported formats are not images."""
+    assert photos._sniff_image_type(head) is None
@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta, timezone
+
+import jwt
+
+from app.core import security
+from app.core.config import settings
+from app.core.security import create_access_token, decode_token_cached
+
+
+def test_decode_token_cached_reuses_verified_payload(monkeypatch):
+    """Repeated access tokens are verified once and then served from cache."""
+    token = create_access_token({"sub": "user-1"})
+    calls = []
+    original = security.decode_token
+
+    def counting_decode(value):
+        calls.append(value)
+        return original(value)
+
+    monkeypatch.setattr(security, "decode_token", counting_decode)
+
+    first = decode_token_cached(token)
+    second = decode_token_cached(token)
+
+    assert first["sub"] == "user-1"
+    assert second == first
+    assert calls == [token]
+
+
+def test_decode_token_cached_drops_expired_entry():
+    """A cached payload is not served once its exp has passed."""
+    token = jwt.encode(
+        {"sub": "user-2", "type": "access",
+         "exp": datetime.now(timezone.utc) + timedelta(minutes=5)},
+        settings.jwt_secret_key,
+        algorithm=settings.jwt_algorithm,
+    )
+    payload = decode_token_cached(token)
+    assert payload is not None
+
+    # Simulate expiry of the cached entry
+    security._token_cache[token] = {**payload, "exp": 0}
+
+    assert decode_token_cached(token) is not None  # re-verified, still valid
+    assert security._token_cache[token]["exp"] > 0
+
+
+def test_decode_token_cached_rejects_invalid_token():
+    """Invalid tokens return None and are not cached."""
+    assert decode_token_cached("not-a-jwt") is None
+    assert "not-a-jwt" not in security._token_cache